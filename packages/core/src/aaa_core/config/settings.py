@@ -99,6 +99,11 @@ def get_config_path() -> Path:
     return project_root / "config" / "config.yaml"
 
 
+def get_cache_dir() -> Path:
+    """Get the directory for regenerable on-disk caches (data/cache/)"""
+    return get_config_path().parent.parent / "data" / "cache"
+
+
 def load_user_config() -> dict:
     """
     Load user configuration from config.yaml if it exists
@@ -14,6 +14,11 @@ from aaa_core.config.console import error, status, success
 
 SOCKET_PATH = "/tmp/aaa_camera.sock"
 
+# Frames are received straight into a small ring of preallocated buffers and
+# returned as read-only views into them. A slot is only rewritten RING_SLOTS
+# frames later, so callers must copy anything they keep longer than that.
+RING_SLOTS = 4
+
 
 class CameraClientSocket:
     """
@@ -42,6 +47,10 @@ class CameraClientSocket:
         self.display_depth_shape = (1080, 1920)
         self.connected = False
 
+        # Receive ring: one dict of segment name -> bytearray per slot
+        self._ring = [{} for _ in range(RING_SLOTS)]
+        self._ring_idx = 0
+
         self._connect()
 
     def _connect(self):
@@ -94,49 +103,47 @@ class CameraClientSocket:
             )
 
             # Receive RGB frame
-            rgb_data = self._recv_exactly(rgb_size)
-            if not rgb_data:
+            rgb_frame = self._recv_frame("rgb", rgb_size, np.uint8, self.rgb_shape)
+            if rgb_frame is None:
                 return None, None, None, None, None
 
             # Receive depth frame
-            depth_data = self._recv_exactly(depth_size)
-            if not depth_data:
+            depth_frame = self._recv_frame(
+                "depth", depth_size, np.uint16, self.depth_shape
+            )
+            if depth_frame is None:
                 return None, None, None, None, None
 
             # Receive aligned color frame (if present)
             aligned_color_frame = None
             if aligned_rgb_size > 0:
-                aligned_color_data = self._recv_exactly(aligned_rgb_size)
-                if not aligned_color_data:
+                aligned_color_frame = self._recv_frame(
+                    "aligned_color", aligned_rgb_size, np.uint8, self.aligned_color_shape
+                )
+                if aligned_color_frame is None:
                     return None, None, None, None, None
-                aligned_color_frame = np.frombuffer(
-                    aligned_color_data, dtype=np.uint8
-                ).reshape(self.aligned_color_shape)
 
             # Receive display depth frame (if present)
             display_depth_frame = None
             if display_depth_size > 0:
-                display_depth_data = self._recv_exactly(display_depth_size)
-                if not display_depth_data:
+                display_depth_frame = self._recv_frame(
+                    "display_depth", display_depth_size, np.uint16,
+                    self.display_depth_shape,
+                )
+                if display_depth_frame is None:
                     return None, None, None, None, None
-                display_depth_frame = np.frombuffer(
-                    display_depth_data, dtype=np.uint16
-                ).reshape(self.display_depth_shape)
 
             # Receive metadata
             metadata_data = self._recv_exactly(metadata_size)
             if not metadata_data:
                 return None, None, None, None, None
 
-            # Reconstruct frames
-            rgb_frame = np.frombuffer(rgb_data, dtype=np.uint8).reshape(self.rgb_shape)
-            depth_frame = np.frombuffer(depth_data, dtype=np.uint16).reshape(
-                self.depth_shape
-            )
-
             # Parse metadata
             metadata = json.loads(metadata_data.decode("utf-8"))
 
+            # Frame complete - the next one goes into the next slot
+            self._ring_idx = (self._ring_idx + 1) % RING_SLOTS
+
             return rgb_frame, depth_frame, metadata, aligned_color_frame, display_depth_frame
 
         except socket.timeout:
@@ -147,6 +154,42 @@ class CameraClientSocket:
             self.connected = False
             return None, None, None, None, None
 
+    def _recv_frame(self, segment, size, dtype, shape):
+        """
+        Receive one frame segment into the current ring slot
+
+        Returns:
+            Read-only numpy view of shape into the slot's buffer, or None if
+            the segment could not be received completely
+        """
+        slot = self._ring[self._ring_idx]
+        buf = slot.get(segment)
+        if buf is None or len(buf) != size:
+            buf = bytearray(size)
+            slot[segment] = buf
+
+        if not self._recv_into(memoryview(buf)):
+            return None
+
+        frame = np.frombuffer(buf, dtype=dtype).reshape(shape)
+        frame.flags.writeable = False
+        return frame
+
+    def _recv_into(self, view):
+        """Fill view completely from socket, returning False if it could not"""
+        received = 0
+        size = len(view)
+        while received < size:
+            try:
+                n = self.socket.recv_into(view[received:])
+            except socket.timeout:
+                return False
+            if n == 0:
+                # Connection closed
+                return False
+            received += n
+        return True
+
     def _recv_exactly(self, size):
         """Receive exactly size bytes from socket"""
         data = b""
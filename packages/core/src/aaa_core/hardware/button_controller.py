@@ -3,9 +3,12 @@ Button Controller for Robotic Arm
 Monitors button press duration to differentiate between press and hold actions
 """
 
+import logging
 import threading
 import time
 
+logger = logging.getLogger(__name__)
+
 
 class ButtonController(threading.Thread):
     """
@@ -34,7 +37,7 @@ class ButtonController(threading.Thread):
             self.elapsed_time = time.time() - self.start_time
 
             if self.button_pushed and self.elapsed_time > self.hold_threshold:
-                print("Button is being held")
+                logger.debug("Button is being held")
                 self.button_pushed = False
 
             time.sleep(0.1)
@@ -58,10 +61,10 @@ class ButtonController(threading.Thread):
 
         elif self.current_state == "released":
             if self.elapsed_time < self.hold_threshold:
-                print(f"{button_name} was pressed")
+                logger.debug("%s was pressed", button_name)
                 self.button_pushed = False
             else:
-                print(f"{button_name} held for {self.elapsed_time:.2f} seconds")
+                logger.debug("%s held for %.2f seconds", button_name, self.elapsed_time)
 
     def stop(self):
         """Stop the button controller thread"""
@@ -155,6 +155,38 @@ class CameraManager:
 
         return self.cameras
 
+    def get_device_signature(self) -> List[str]:
+        """
+        Get a cheap description of the attached video devices
+
+        Uses OS device listings only (no cameras are opened), so it can be
+        compared against a previous run to tell whether enumeration needs
+        to be repeated.
+
+        Returns:
+            List of device names in OS order
+        """
+        platform_name = platform.system()
+        if platform_name == "Darwin":
+            return list(self._get_macos_camera_names())
+        if platform_name == "Windows":
+            return self._get_windows_camera_names()
+
+        # Linux - Video4Linux exposes a name per device node
+        names = []
+        sys_root = "/sys/class/video4linux"
+        try:
+            nodes = sorted(os.listdir(sys_root))
+        except OSError:
+            return names
+        for node in nodes:
+            try:
+                with open(os.path.join(sys_root, node, "name")) as f:
+                    names.append(f"{node}:{f.read().strip()}")
+            except OSError:
+                names.append(node)
+        return names
+
     def _get_camera_indexes(self, indices_to_check: List[int] = None) -> List[int]:
         """
         Find all available camera indices with their properties
@@ -209,6 +209,23 @@ class ArmControllerFlet:
                 logger.error(f"Error getting position: {e}", exc_info=True)
                 return None
 
+    def get_queued_commands(self) -> Optional[int]:
+        """
+        Get the number of motion commands still buffered in the arm.
+
+        Returns:
+            Queued command count or None if unavailable
+        """
+        with self._lock:
+            if not self.arm or not self.arm.connected:
+                return None
+
+            try:
+                return self.arm.get_queued_commands()
+            except Exception as e:
+                logger.error(f"Error getting command count: {e}", exc_info=True)
+                return None
+
     def set_gripper(self, position: int, speed: int = 5000, wait: bool = False) -> bool:
         """
         Set gripper position.
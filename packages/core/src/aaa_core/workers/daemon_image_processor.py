@@ -8,6 +8,7 @@ import threading
 import time
 from typing import Callable, Optional
 
+import cv2
 import numpy as np
 from aaa_vision.detection_manager import DetectionManager
 
@@ -15,6 +16,16 @@ from aaa_core.config.console import error, status, success, warning
 from aaa_core.daemon.camera_client_socket import CameraClientSocket
 from aaa_core.workers._overlay_mixin import OverlayMixin
 
+# Brightness is sampled at 5 Hz on a 4x-subsampled luma plane - plenty for
+# auto-exposure, at a small fraction of a full-frame RGB mean per frame
+_BRIGHTNESS_SAMPLE_INTERVAL_S = 0.2
+_BRIGHTNESS_SUBSAMPLE = 4
+
+
+def _own_copy(frame):
+    """Copy a frame out of the client's receive ring (None passes through)"""
+    return None if frame is None else frame.copy()
+
 
 class DaemonImageProcessor(OverlayMixin, threading.Thread):
     """
@@ -69,8 +80,12 @@ class DaemonImageProcessor(OverlayMixin, threading.Thread):
         # Shared overlay state (reference point, depth visualization)
         self._init_overlay_state()
 
-        # Store last RGB frame for re-detection
+        # Store last RGB frame for re-detection. _last_rgb also holds it as
+        # (frame, frame_id), the id passed to the detection manager for it,
+        # published in one assignment so readers always get a matching pair
         self._last_rgb_frame = None
+        self._last_rgb = None
+        self._frame_id = 0
 
         # Store last depth frame for point cloud extraction
         self.depth_frame = None
@@ -81,11 +96,12 @@ class DaemonImageProcessor(OverlayMixin, threading.Thread):
         # Store last display depth frame (1920x1080, aligned to color FOV for display)
         self._last_display_depth = None
 
-        # Track recent frame brightness for auto-exposure (rolling buffer of ~2 seconds @ 30fps)
+        # Track recent frame brightness for auto-exposure (rolling buffer of ~2 seconds @ 5 Hz)
         from collections import deque
 
-        self._brightness_history = deque(maxlen=60)  # 60 frames = 2 seconds at 30fps
+        self._brightness_history = deque(maxlen=10)  # 10 samples = 2 seconds at 5 Hz
         self._brightness_lock = threading.Lock()
+        self._last_brightness_sample = 0.0
 
     def run(self):
         """Main processing loop - read frames from daemon"""
@@ -106,35 +122,46 @@ class DaemonImageProcessor(OverlayMixin, threading.Thread):
                     if frame_count % 30 == 0:  # Debug every 30 frames
                         status(f"[DaemonImageProcessor] Received frame {frame_count}")
 
-                    # Convert BGR to RGB (RealSense provides BGR)
-                    image_rgb = rgb_frame[:, :, ::-1].copy()
+                    # Convert BGR to RGB (RealSense provides BGR). The client's
+                    # frames are read-only views into its receive ring; the
+                    # conversion writes a new array, so detection never reads
+                    # the ring slot itself.
+                    image_rgb = cv2.cvtColor(rgb_frame, cv2.COLOR_BGR2RGB)
 
                     # Store for re-detection
-                    self._last_rgb_frame = image_rgb.copy()
+                    self._frame_id += 1
+                    last_rgb_frame = image_rgb.copy()
+                    self._last_rgb_frame = last_rgb_frame
+                    self._last_rgb = (last_rgb_frame, self._frame_id)
+
+                    # The frames below are kept until the next frame and read
+                    # from other threads (freeze snapshot, depth fusion,
+                    # click-to-move), while the client rewrites its ring slots
+                    # a few frames later. Keep our own copies: each published
+                    # array is never written again, so a reader holding one
+                    # can't see it torn by the receive loop.
 
                     # Store depth frame for point cloud extraction
-                    self.depth_frame = (
-                        depth_frame.copy() if depth_frame is not None else None
-                    )
+                    self.depth_frame = _own_copy(depth_frame)
 
                     # Store aligned color (848x480, pixel-aligned to depth)
-                    self._last_aligned_color = (
-                        aligned_color.copy() if aligned_color is not None else None
-                    )
+                    self._last_aligned_color = _own_copy(aligned_color)
 
                     # Store display depth (1920x1080, aligned to color FOV)
-                    self._last_display_depth = (
-                        display_depth.copy() if display_depth is not None else None
-                    )
+                    self._last_display_depth = _own_copy(display_depth)
 
-                    # Track brightness for auto-exposure (calculate from RGB)
-                    avg_brightness = np.mean(image_rgb)
-                    with self._brightness_lock:
-                        self._brightness_history.append(avg_brightness)
+                    # Track brightness for auto-exposure (luma of a subsampled view)
+                    now = time.monotonic()
+                    if now - self._last_brightness_sample >= _BRIGHTNESS_SAMPLE_INTERVAL_S:
+                        self._last_brightness_sample = now
+                        step = _BRIGHTNESS_SUBSAMPLE
+                        luma = cv2.cvtColor(rgb_frame[::step, ::step], cv2.COLOR_BGR2GRAY)
+                        with self._brightness_lock:
+                            self._brightness_history.append(float(luma.mean()))
 
                     # Process with detection manager
                     processed_frame = self.detection_manager.process_frame(
-                        image_rgb, depth_frame=depth_frame
+                        image_rgb, depth_frame=depth_frame, frame_id=self._frame_id
                     )
 
                     # Draw fixed reference point depth measurement
@@ -5,6 +5,8 @@ Handles camera capture, detection processing, and image conversion
 
 import sys
 import threading
+import time
+from collections import deque
 from typing import Callable, Optional
 
 import cv2
@@ -15,6 +17,11 @@ from aaa_core.config.console import error, status, success, underline
 from aaa_core.config.settings import app_config
 from aaa_core.workers._overlay_mixin import OverlayMixin
 
+# Brightness is sampled at 5 Hz on a 4x-subsampled luma plane - plenty for
+# auto-exposure, at a small fraction of a full-frame RGB mean per frame
+_BRIGHTNESS_SAMPLE_INTERVAL_S = 0.2
+_BRIGHTNESS_SUBSAMPLE = 4
+
 
 class ImageProcessor(OverlayMixin, threading.Thread):
     """
@@ -53,8 +60,13 @@ class ImageProcessor(OverlayMixin, threading.Thread):
         # Shared overlay state (reference point, depth visualization)
         self._init_overlay_state()
 
-        # Store last raw RGB frame for frozen frame re-processing
+        # Store last raw RGB frame for frozen frame re-processing. _last_rgb
+        # also holds it as (frame, frame_id), the id passed to the detection
+        # manager for it, published in one assignment so readers always get
+        # a matching pair
         self._last_rgb_frame = None
+        self._last_rgb = None
+        self._frame_id = 0
 
         # Store last aligned color frame (848x480, pixel-aligned to depth)
         self._last_aligned_color = None
@@ -66,6 +78,11 @@ class ImageProcessor(OverlayMixin, threading.Thread):
         self.flip_horizontal = False
         self.current_camera_name = None
 
+        # Track recent frame brightness for auto-exposure (rolling buffer of ~2 seconds @ 5 Hz)
+        self._brightness_history = deque(maxlen=10)  # 10 samples = 2 seconds at 5 Hz
+        self._brightness_lock = threading.Lock()
+        self._last_brightness_sample = 0.0
+
         # Camera will be initialized when thread starts (in run() method)
         # to avoid blocking the UI thread
 
@@ -224,6 +241,9 @@ class ImageProcessor(OverlayMixin, threading.Thread):
             status("Keeping current camera")
             return
 
+        # Detections from the old camera must not be reused on the new one
+        self.detection_manager.clear_object_detection()
+
         # Check if this is a RealSense camera on Windows/Linux - use SDK for depth
         is_realsense = camera_name and "RealSense" in camera_name
         use_sdk = (
@@ -360,15 +380,27 @@ class ImageProcessor(OverlayMixin, threading.Thread):
                     if self._last_display_depth is not None:
                         self._last_display_depth = cv2.flip(self._last_display_depth, 1)
 
+                # Track brightness for auto-exposure (luma of a subsampled view)
+                now = time.monotonic()
+                if now - self._last_brightness_sample >= _BRIGHTNESS_SAMPLE_INTERVAL_S:
+                    self._last_brightness_sample = now
+                    step = _BRIGHTNESS_SUBSAMPLE
+                    luma = cv2.cvtColor(frame[::step, ::step], cv2.COLOR_BGR2GRAY)
+                    with self._brightness_lock:
+                        self._brightness_history.append(float(luma.mean()))
+
                 # Convert to RGB
                 image_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
                 # Store the raw RGB frame (before processing) for frozen frame re-processing
-                self._last_rgb_frame = image_rgb.copy()
+                self._frame_id += 1
+                last_rgb_frame = image_rgb.copy()
+                self._last_rgb_frame = last_rgb_frame
+                self._last_rgb = (last_rgb_frame, self._frame_id)
 
                 # Process with detection (labels will now be correct orientation)
                 processed_image = self.detection_manager.process_frame(
-                    image_rgb, depth_frame
+                    image_rgb, depth_frame, frame_id=self._frame_id
                 )
 
                 # Draw fixed reference point depth measurement if RealSense is active
@@ -442,6 +474,23 @@ class ImageProcessor(OverlayMixin, threading.Thread):
         """Check if object detection is available"""
         return self.detection_manager.has_object_detection
 
+    def get_recent_brightness(self) -> float:
+        """
+        Get average brightness from recent frames (~2 seconds)
+
+        Returns:
+            float: Average brightness (0-255), or 128 if no data available
+        """
+        with self._brightness_lock:
+            if len(self._brightness_history) == 0:
+                return 128.0  # Default middle brightness
+            return float(np.mean(self._brightness_history))
+
+    def clear_brightness_history(self):
+        """Clear brightness history buffer (useful after exposure changes)"""
+        with self._brightness_lock:
+            self._brightness_history.clear()
+
     def stop(self):
         """Stop the processing thread"""
         # Signal thread to stop
@@ -0,0 +1,78 @@
+"""On-disk cache of the camera enumeration result.
+
+Enumerating cameras opens every candidate device index, which costs
+hundreds of milliseconds per index. The result is stored in
+data/cache/cameras.json together with a fingerprint of the attached
+devices and the camera settings, and reused on the next launch as long as
+the fingerprint still matches.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import platform
+
+from aaa_core.config.settings import app_config, get_cache_dir
+
+_CACHE_FILE = "cameras.json"
+_CACHE_VERSION = 1  # Bump when the stored camera dict format changes
+
+
+def camera_fingerprint(camera_manager) -> str | None:
+    """
+    Hash the attached video devices and the settings that affect enumeration
+
+    Returns:
+        Hex digest, or None if the device list could not be read
+    """
+    try:
+        devices = camera_manager.get_device_signature()
+    except Exception:
+        return None
+
+    key = {
+        "version": _CACHE_VERSION,
+        "platform": platform.system(),
+        "devices": devices,
+        "max_cameras_to_check": app_config.max_cameras_to_check,
+        "skip_cameras": list(app_config.skip_cameras),
+    }
+    return hashlib.sha1(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+
+def load_cache(fingerprint: str | None) -> list | None:
+    """
+    Load the cached camera list if it was saved for the same fingerprint
+
+    Returns:
+        List of camera dicts (as from CameraManager.get_camera_info), or None
+        if there is no usable cache (an empty list counts as none, so a
+        failed probe is always retried)
+    """
+    if fingerprint is None:
+        return None
+    try:
+        with open(get_cache_dir() / _CACHE_FILE) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("fingerprint") != fingerprint:
+        return None
+    cameras = data.get("cameras")
+    return cameras if isinstance(cameras, list) and cameras else None
+
+
+def save_cache(fingerprint: str | None, cameras: list):
+    """Store the camera list for the given fingerprint (failures are ignored)"""
+    # No cameras usually means a busy device or a failed probe; caching that
+    # would hide the cameras until the device list changes
+    if fingerprint is None or not cameras:
+        return
+    cache_dir = get_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(cache_dir / _CACHE_FILE, "w") as f:
+            json.dump({"fingerprint": fingerprint, "cameras": cameras}, f, indent=2)
+    except OSError as e:
+        print(f"[WARN] Could not write camera cache: {e}")
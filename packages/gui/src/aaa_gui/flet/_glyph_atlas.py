@@ -0,0 +1,168 @@
+"""Pre-rendered glyph atlas for drawing TrueType labels onto frames.
+
+PIL is used once per glyph to rasterise it into an alpha tile; labels are
+then composed from those tiles with NumPy and blended straight into the
+frame array, so no per-label ndarray <-> PIL.Image round-trip is needed.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+# Printable ASCII is rendered up front; anything else is added on first use
+_PRELOAD_CHARS = "".join(chr(c) for c in range(32, 127))
+
+# Label strings repeat across redraws ("#3: cup"); bboxes and composed
+# masks are kept per string
+_BBOX_CACHE_SIZE = 512
+
+
+def load_label_font(font_size: int):
+    """Load the label font, falling back through common system fonts"""
+    try:
+        # Try common modern fonts
+        return ImageFont.truetype(
+            "/System/Library/Fonts/SFNS.ttf", font_size
+        )  # macOS San Francisco
+    except OSError:
+        pass
+    try:
+        return ImageFont.truetype(
+            "/System/Library/Fonts/Helvetica.ttc", font_size
+        )  # macOS Helvetica
+    except OSError:
+        pass
+    try:
+        return ImageFont.truetype("arial.ttf", font_size)  # Windows
+    except OSError:
+        return ImageFont.load_default()  # Fallback
+
+
+class GlyphAtlas:
+    """Alpha tiles and metrics for every glyph of one font size."""
+
+    def __init__(self, font_size: int):
+        self.font_size = font_size
+        self.font = load_label_font(font_size)
+        # char -> (alpha tile uint8 (h, w), left, top, advance)
+        self._glyphs = {}
+        self._bboxes = {}  # text -> (left, top, right, bottom)
+        self._masks = {}  # text -> (alpha mask, left, top), read-only
+        for ch in _PRELOAD_CHARS:
+            self._glyph(ch)
+
+    def _glyph(self, ch: str):
+        """Return (tile, left, top, advance) for ch, rendering it if needed"""
+        glyph = self._glyphs.get(ch)
+        if glyph is not None:
+            return glyph
+
+        left, top, right, bottom = self.font.getbbox(ch)
+        advance = self.font.getlength(ch)
+        w, h = right - left, bottom - top
+        if w > 0 and h > 0:
+            tile_img = Image.new("L", (w, h), 0)
+            ImageDraw.Draw(tile_img).text((-left, -top), ch, font=self.font, fill=255)
+            tile = np.asarray(tile_img, dtype=np.uint8)
+        else:
+            tile = np.zeros((0, 0), dtype=np.uint8)  # Whitespace
+
+        glyph = (tile, left, top, advance)
+        self._glyphs[ch] = glyph
+        return glyph
+
+    def _layout(self, text: str):
+        """Yield (tile, x, y) for each inked glyph relative to the text origin"""
+        pen = 0.0
+        for ch in text:
+            tile, left, top, advance = self._glyph(ch)
+            if tile.size:
+                yield tile, int(round(pen)) + left, top
+            pen += advance
+
+    def textbbox(self, text: str):
+        """
+        Bounding box of text drawn at origin (0, 0), like ImageDraw.textbbox
+
+        Returns:
+            Tuple of (left, top, right, bottom)
+        """
+        bbox = self._bboxes.get(text)
+        if bbox is not None:
+            return bbox
+
+        boxes = [
+            (x, y, x + tile.shape[1], y + tile.shape[0])
+            for tile, x, y in self._layout(text)
+        ]
+        if not boxes:
+            bbox = (0, 0, 0, 0)
+        else:
+            bbox = (
+                min(b[0] for b in boxes),
+                min(b[1] for b in boxes),
+                max(b[2] for b in boxes),
+                max(b[3] for b in boxes),
+            )
+
+        if len(self._bboxes) >= _BBOX_CACHE_SIZE:
+            self._bboxes.clear()
+        self._bboxes[text] = bbox
+        return bbox
+
+    def render(self, text: str):
+        """
+        Compose text into a single alpha mask
+
+        Returns:
+            Tuple of (alpha uint8 (h, w), left, top) where (left, top) is the
+            mask's offset from the text origin. The mask is cached and shared
+            between calls, so it is read-only
+        """
+        cached = self._masks.get(text)
+        if cached is not None:
+            return cached
+
+        left, top, right, bottom = self.textbbox(text)
+        mask = np.zeros((bottom - top, right - left), dtype=np.uint8)
+        for tile, x, y in self._layout(text):
+            h, w = tile.shape
+            region = mask[y - top : y - top + h, x - left : x - left + w]
+            np.maximum(region, tile, out=region)
+        mask.flags.writeable = False
+
+        if len(self._masks) >= _BBOX_CACHE_SIZE:
+            self._masks.clear()
+        self._masks[text] = (mask, left, top)
+        return mask, left, top
+
+
+@lru_cache(maxsize=8)
+def get_glyph_atlas(font_size: int) -> GlyphAtlas:
+    """Shared atlas for a font size (built on first use)"""
+    return GlyphAtlas(font_size)
+
+
+def blend_alpha_mask(img, mask, x: int, y: int, color):
+    """
+    Blend a solid color into img through an alpha mask, in place
+
+    Args:
+        img: Numpy array (H, W, 3) uint8
+        mask: Alpha mask (h, w) uint8, 255 = fully opaque
+        x, y: Position of the mask's top-left corner in img
+        color: 3-tuple in the same channel order as img
+    """
+    h, w = mask.shape
+    x1, y1 = max(x, 0), max(y, 0)
+    x2, y2 = min(x + w, img.shape[1]), min(y + h, img.shape[0])
+    if x2 <= x1 or y2 <= y1:
+        return
+
+    alpha = mask[y1 - y : y2 - y, x1 - x : x2 - x, None].astype(np.float32) / 255.0
+    roi = img[y1:y2, x1:x2]
+    color_arr = np.asarray(color, dtype=np.float32)
+    roi[:] = (roi * (1.0 - alpha) + color_arr * alpha + 0.5).astype(np.uint8)
@@ -0,0 +1,192 @@
+"""Force-directed (ggrepel-style) placement of frozen-frame labels.
+
+Labels start centered above their objects, push apart while their padded
+boxes overlap and are pulled back toward their anchor by a spring. The
+solver runs as a Numba kernel when numba is installed (plain nested loops
+are fastest for the few dozen labels on a frame) and as a broadcast NumPy
+version otherwise. Both produce the same positions.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+_PAD = 10  # Extra clearance around each label for the overlap test
+_REPULSION = 15.0
+_SPRING = 0.15
+_DAMPING = 0.8
+_MARGIN = 10  # Minimum distance from the image border
+
+# Push direction for labels whose centers coincide
+_TIE_DX, _TIE_DY = 20.0, 10.0
+
+# Labels placed farther than this from their object get a leader line
+_LEADER_MIN_DISTANCE = 30
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, nogil=True)
+    def _solve_kernel(x, y, w, h, max_x, max_y, iterations):
+        n = x.shape[0]
+        anchor_x = x.copy()
+        anchor_y = y.copy()
+        fx = np.empty(n)
+        fy = np.empty(n)
+        for _ in range(iterations):
+            fx[:] = 0.0
+            fy[:] = 0.0
+
+            # Repulsion between overlapping labels
+            for i in range(n):
+                for j in range(i + 1, n):
+                    if (
+                        x[i] + w[i] + _PAD < x[j] - _PAD
+                        or x[j] + w[j] + _PAD < x[i] - _PAD
+                        or y[i] + h[i] + _PAD < y[j] - _PAD
+                        or y[j] + h[j] + _PAD < y[i] - _PAD
+                    ):
+                        continue
+                    dx = (x[j] + w[j] / 2) - (x[i] + w[i] / 2)
+                    dy = (y[j] + h[j] / 2) - (y[i] + h[i] / 2)
+                    dist = np.sqrt(dx * dx + dy * dy)
+                    if dist < 1:
+                        dx, dy = _TIE_DX, _TIE_DY
+                        dist = np.sqrt(dx * dx + dy * dy)
+                    px = dx / dist * _REPULSION
+                    py = dy / dist * _REPULSION
+                    fx[i] -= px
+                    fy[i] -= py
+                    fx[j] += px
+                    fy[j] += py
+
+            # Spring toward anchor, then damped step kept in bounds
+            for i in range(n):
+                fx[i] += (anchor_x[i] - x[i]) * _SPRING
+                fy[i] += (anchor_y[i] - y[i]) * _SPRING
+                x[i] = max(_MARGIN, min(x[i] + fx[i] * _DAMPING, max_x[i]))
+                y[i] = max(_MARGIN, min(y[i] + fy[i] * _DAMPING, max_y[i]))
+        return x, y
+
+
+def _solve_numpy(x, y, w, h, max_x, max_y, iterations):
+    n = x.shape[0]
+    anchor_x = x.copy()
+    anchor_y = y.copy()
+
+    # Unit push for coincident labels: the lower-index label of a pair
+    # moves away along -(20, 10), the other along +(20, 10)
+    tie_x, tie_y = np.array([_TIE_DX, _TIE_DY]) / np.hypot(_TIE_DX, _TIE_DY)
+    tie_sign = np.where(np.arange(n)[:, None] < np.arange(n)[None, :], 1.0, -1.0)
+    not_self = ~np.eye(n, dtype=bool)
+
+    for _ in range(iterations):
+        # Repulsion between overlapping labels (padded boxes touch)
+        x1, y1 = x - _PAD, y - _PAD
+        x2, y2 = x + w + _PAD, y + h + _PAD
+        overlap = (
+            (x2[:, None] >= x1[None, :])
+            & (x2[None, :] >= x1[:, None])
+            & (y2[:, None] >= y1[None, :])
+            & (y2[None, :] >= y1[:, None])
+            & not_self
+        )
+
+        lcx = x + w / 2
+        lcy = y + h / 2
+        dx = lcx[None, :] - lcx[:, None]
+        dy = lcy[None, :] - lcy[:, None]
+        dist = np.hypot(dx, dy)
+        close = dist < 1
+        safe = np.where(close, 1.0, dist)
+        ux = np.where(close, tie_sign * tie_x, dx / safe)
+        uy = np.where(close, tie_sign * tie_y, dy / safe)
+
+        fx = -_REPULSION * np.where(overlap, ux, 0.0).sum(axis=1)
+        fy = -_REPULSION * np.where(overlap, uy, 0.0).sum(axis=1)
+
+        # Spring force toward anchor
+        fx += (anchor_x - x) * _SPRING
+        fy += (anchor_y - y) * _SPRING
+
+        # Apply forces with damping, keeping labels in bounds
+        x = np.maximum(_MARGIN, np.minimum(x + fx * _DAMPING, max_x))
+        y = np.maximum(_MARGIN, np.minimum(y + fy * _DAMPING, max_y))
+    return x, y
+
+
+def _any_overlap(x, y, w, h):
+    """True if any two padded label boxes touch (same test as the solvers)"""
+    if x.shape[0] < 2:
+        return False
+    x1, y1 = x - _PAD, y - _PAD
+    x2, y2 = x + w + _PAD, y + h + _PAD
+    overlap = (
+        (x2[:, None] >= x1[None, :])
+        & (x2[None, :] >= x1[:, None])
+        & (y2[:, None] >= y1[None, :])
+        & (y2[None, :] >= y1[:, None])
+    )
+    np.fill_diagonal(overlap, False)
+    return bool(overlap.any())
+
+
+def needs_leader_line(centers, label_positions):
+    """
+    Flag the labels that ended up far enough from their object to need a
+    connector line
+
+    Args:
+        centers: (x, y) object centers
+        label_positions: (x, y) label positions, one per label
+
+    Returns:
+        Bool array with one entry per label position
+    """
+    n = len(label_positions)
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+    offset = np.asarray(label_positions, dtype=np.float64) - np.asarray(
+        centers[:n], dtype=np.float64
+    )
+    return np.hypot(offset[:, 0], offset[:, 1]) > _LEADER_MIN_DISTANCE
+
+
+def solve_label_layout(x, y, w, h, img_width, img_height, iterations=50):
+    """
+    Spread labels apart so their boxes don't overlap
+
+    Args:
+        x, y: Initial top-left corners (float arrays); also the spring anchors
+        w, h: Label sizes (arrays)
+        img_width, img_height: Image size used to keep labels in bounds
+        iterations: Number of relaxation steps
+
+    Returns:
+        Tuple of (x, y) float64 arrays with the final top-left corners
+    """
+    x = np.array(x, dtype=np.float64)
+    y = np.array(y, dtype=np.float64)
+    w = np.asarray(w, dtype=np.float64)
+    h = np.asarray(h, dtype=np.float64)
+    max_x = img_width - w - _MARGIN
+    max_y = img_height - h - _MARGIN
+
+    # Sparse scenes (often a single label): if nothing overlaps either where
+    # the labels start or once pulled in bounds, the solver would only clamp
+    # them, so skip the iterations
+    clamped_x = np.maximum(_MARGIN, np.minimum(x, max_x))
+    clamped_y = np.maximum(_MARGIN, np.minimum(y, max_y))
+    if not _any_overlap(x, y, w, h) and not _any_overlap(clamped_x, clamped_y, w, h):
+        return clamped_x, clamped_y
+
+    if NUMBA_AVAILABLE:
+        return _solve_kernel(x, y, w, h, max_x, max_y, iterations)
+    return _solve_numpy(x, y, w, h, max_x, max_y, iterations)
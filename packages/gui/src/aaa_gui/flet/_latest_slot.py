@@ -0,0 +1,74 @@
+"""Single-slot "latest value wins" hand-off between threads."""
+
+from __future__ import annotations
+
+import threading
+
+
+class LatestSlot:
+    """Holds only the newest value put into it.
+
+    Producers never block: ``put`` overwrites whatever is in the slot. The
+    consumer blocks in ``get`` until a value newer than the last one it
+    consumed is available, so a slow consumer always sees the most recent
+    frame instead of working through a backlog of stale ones.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._value = None
+        self._seq = 0  # Incremented on every put
+        self._consumed_seq = 0  # Sequence number of the last value returned
+        self._closed = False
+        self.dropped = 0  # Values overwritten before they were consumed
+
+    @property
+    def closed(self) -> bool:
+        """True once close() has been called"""
+        return self._closed
+
+    def put(self, value):
+        """Store value, replacing any unconsumed one, and wake the consumer"""
+        with self._cond:
+            if self._seq != self._consumed_seq:
+                self.dropped += 1
+            self._value = value
+            self._seq += 1
+            self._cond.notify()
+
+    def get(self, timeout: float | None = None):
+        """
+        Wait for a value newer than the last one consumed
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            The newest value, or None on timeout or after close()
+        """
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._closed or self._seq != self._consumed_seq, timeout
+            )
+            if self._closed or self._seq == self._consumed_seq:
+                return None
+            self._consumed_seq = self._seq
+            return self._value
+
+    def take_dropped(self) -> int:
+        """Return the dropped-value count since the last call and reset it"""
+        with self._cond:
+            dropped, self.dropped = self.dropped, 0
+            return dropped
+
+    def close(self):
+        """Wake any waiting consumer; subsequent get() calls return None"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def reopen(self):
+        """Allow the slot to be used again after close()"""
+        with self._cond:
+            self._closed = False
+            self._consumed_seq = self._seq
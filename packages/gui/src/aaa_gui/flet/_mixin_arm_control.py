@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import logging
 import threading
 import time
 from typing import TYPE_CHECKING
@@ -15,6 +18,10 @@ import flet as ft
 
 from aaa_core.config.settings import app_config
 
+from . import _design_tokens as T
+
+logger = logging.getLogger(__name__)
+
 # Camera intrinsic: approximate focal length for RealSense D435 at 1920x1080
 _CAM_FX = 1386.0
 
@@ -39,6 +46,42 @@ _ROTATE_STEP_DEG = 5.0
 # Interval between repeated move commands during press-and-hold (seconds)
 _CONTINUOUS_INTERVAL_S = 0.08
 
+# Gripper positions read (or commanded) within this window are reused by
+# the grip buttons instead of querying the arm again
+_GRIP_POS_CACHE_TTL_S = 0.1
+
+# Press-and-hold skips a repeat while the arm still has more than this many
+# moves buffered, so commands never pile up faster than the arm executes them
+_MAX_QUEUED_MOVES = 2
+
+# Button → (tool-frame delta index, sign, rotational) for move_relative_tool.
+# Delta order is (dx, dy, dz, droll, dpitch, dyaw); rotational entries use
+# the rotation step, the rest the translation step
+_JOG_AXES = {
+    "x_pos": (0, -1.0, False),
+    "x_neg": (0, 1.0, False),
+    "y_pos": (1, 1.0, False),
+    "y_neg": (1, -1.0, False),
+    "z_pos": (2, 1.0, False),
+    "z_neg": (2, -1.0, False),
+    "pitch_pos": (3, -1.0, True),  # pitch → tool X → SDK roll (Rx)
+    "pitch_neg": (3, 1.0, True),
+    "yaw_pos": (4, -1.0, True),  # yaw → tool Y → SDK pitch (Ry)
+    "yaw_neg": (4, 1.0, True),
+    "roll_pos": (5, 1.0, True),  # roll → tool Z → SDK yaw (Rz)
+    "roll_neg": (5, -1.0, True),
+}
+
+# Grip button → direction of the gripper position step (0 = open, 800 =
+# closed), scaled by the movement speed
+_GRIP_STEP = 100.0
+_GRIP_DIRECTIONS = {"grip_pos": 1.0, "grip_neg": -1.0}
+_GRIP_RANGE = (0, 800)
+
+# Arm status text colors
+_STATUS_OK_COLOR = "#2E7D32"  # Green 800
+_STATUS_ERROR_COLOR = "#C62828"  # Red 800
+
 # Edge zone → rotation axis remapping (translate axis → rotate axis)
 _TRANSLATE_TO_ROTATE = {
     ("x", "neg"): ("yaw",   "neg"),
@@ -50,6 +93,28 @@ _TRANSLATE_TO_ROTATE = {
 }
 
 
+def _requires_arm(message: str | None = None):
+    """
+    Decorator for handlers that need a connected arm
+
+    The wrapped method returns None without running (printing message, if
+    given) unless self._arm_ready is True.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self._arm_ready:
+                if message:
+                    print(message)
+                return None
+            return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 class ArmControlMixin:
     """Mixin that provides robotic-arm control methods for MainWindow.
 
@@ -57,33 +122,53 @@ class ArmControlMixin:
     connection lifecycle, and status UI updates.
     """
 
+    @property
+    def _arm_ready(self: FletMainWindow) -> bool:
+        """True if an arm controller with a connected arm is available"""
+        arm_controller = self.arm_controller
+        if not arm_controller:
+            return False
+        arm = arm_controller.arm
+        return bool(arm and arm.connected)
+
     def _on_button_press(self: FletMainWindow, direction: str, button_type: str):
         """Handle robotic arm button press (mode-aware: translate or rotate)."""
         # In rotate mode remap edge-zone axes to pitch/yaw
-        if getattr(self, "control_mode", "translate") == "rotate":
+        if self.control_mode == "rotate":
             direction, button_type = _TRANSLATE_TO_ROTATE.get(
                 (direction, button_type), (direction, button_type)
             )
         button_name = f"{direction}_{button_type}"
-        print(f"Button {button_name} pressed")
+        logger.debug("Button %s pressed", button_name)
 
         start_time = time.time()
         self.button_controller.update_button_state("pressed", start_time, button_name)
 
-        # Simulate release after brief moment and execute arm command
-        def on_release():
-            duration = time.time() - start_time
-            self.button_controller.update_button_state("released", 0, button_name)
-            self._handle_arm_command(button_name, duration)
-
-        threading.Timer(0.1, on_release).start()
+        # Simulate release after brief moment and execute arm command. Runs
+        # on the page's event loop instead of starting a Timer thread per tap
+        self.page.run_task(self._release_button_after, button_name, start_time, 0.1)
+
+    async def _release_button_after(
+        self: FletMainWindow, button_name: str, start_time: float, delay: float
+    ):
+        """Release a tapped button after delay and send its arm command"""
+        await asyncio.sleep(delay)
+        duration = time.time() - start_time
+        self.button_controller.update_button_state("released", 0, button_name)
+        # The arm command blocks on the network; keep it off the UI loop
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self._arm_cmd_pool, self._handle_arm_command, button_name, duration
+            )
+        except Exception as e:
+            print(f"Arm command {button_name} failed: {e}")
 
     def _start_continuous_move(self: FletMainWindow, direction: str, button_type: str):
         """Begin continuous movement on long-press start."""
         self._stop_continuous_move()
 
         # Remap axes for rotate mode (same logic as _on_button_press)
-        if getattr(self, "control_mode", "translate") == "rotate":
+        if self.control_mode == "rotate":
             direction, button_type = _TRANSLATE_TO_ROTATE.get(
                 (direction, button_type), (direction, button_type)
             )
@@ -99,11 +184,11 @@ class ArmControlMixin:
 
     def _stop_continuous_move(self: FletMainWindow):
         """Stop continuous movement on long-press end."""
-        stop_evt = getattr(self, "_hold_stop_event", None)
+        stop_evt = self._hold_stop_event
         if stop_evt is not None:
             stop_evt.set()
 
-        hold_thread = getattr(self, "_hold_thread", None)
+        hold_thread = self._hold_thread
         if hold_thread is not None and hold_thread.is_alive():
             hold_thread.join(timeout=0.2)
 
@@ -118,24 +203,29 @@ class ArmControlMixin:
         """Background thread: send repeated small moves until stopped."""
         stop_evt = self._hold_stop_event
         while not stop_evt.is_set():
-            self._handle_arm_command(button_name, duration=0.0)
+            # Drop this repeat if the arm is behind; the next tick retries.
+            # Unknown counts (None) don't hold movement back
+            queued = self.arm_controller.get_queued_commands() if self.arm_controller else None
+            if queued is None or queued <= _MAX_QUEUED_MOVES:
+                self._handle_arm_command(button_name, duration=0.0)
             stop_evt.wait(_CONTINUOUS_INTERVAL_S)
 
     def _on_speed_changed(self: FletMainWindow, e):
         """Handle speed slider change"""
         self.movement_speed_percent = int(e.control.value)
         self.speed_label.value = f"Speed: {self.movement_speed_percent}%"
-        self.page.update()
-        print(f"Movement speed set to: {self.movement_speed_percent}%")
+        self._mark(self.speed_label)
+        logger.debug("Movement speed set to: %d%%", self.movement_speed_percent)
 
     def _on_grip_state_changed(self: FletMainWindow, is_closed: bool):
         """Handle grip state toggle"""
         state = "closed" if is_closed else "open"
-        print(f"Grip state: {state}")
+        logger.debug("Grip state: %s", state)
         self.button_controller.update_button_state("clicked", 0, "grip_state")
 
         # Control gripper if arm is connected
-        if self.arm_controller and self.arm_controller.arm:
+        if self._arm_ready:
+            self._grip_pos_cache = None
             if is_closed:
                 self.arm_controller.close_gripper(
                     speed=app_config.gripper_speed, wait=False
@@ -145,6 +235,7 @@ class ArmControlMixin:
                     speed=app_config.gripper_speed, wait=False
                 )
 
+    @_requires_arm("Arm not connected - cannot move")
     def _handle_arm_command(self: FletMainWindow, button_name: str, duration: float):
         """
         Handle arm movement command based on button press.
@@ -153,68 +244,53 @@ class ArmControlMixin:
             button_name: Name of button pressed (e.g., "x_pos", "y_neg")
             duration: Duration of button press in seconds
         """
-        if not self.arm_controller or not self.arm_controller.arm:
-            return
+        arm_controller = self.arm_controller
+        arm = arm_controller.arm
 
-        if not self.arm_controller.arm.connected:
-            print("Arm not connected - cannot move")
-            return
+        speed_percent = self.movement_speed_percent
+        speed_scale = speed_percent / 100.0
 
         # Gripper controls are handled separately (no tool-frame move needed)
-        if button_name in ("grip_pos", "grip_neg"):
-            current_grip = self.arm_controller.arm.get_gripper_position() or 400
-            grip_step = 100 * (self.movement_speed_percent / 100.0)
-            if button_name == "grip_pos":
-                new_grip = min(800, current_grip + grip_step)
+        grip_direction = _GRIP_DIRECTIONS.get(button_name)
+        if grip_direction is not None:
+            now = time.monotonic()
+            cached = self._grip_pos_cache
+            if cached is not None and now - cached[1] < _GRIP_POS_CACHE_TTL_S:
+                current_grip = cached[0]
             else:
-                new_grip = max(0, current_grip - grip_step)
-            self.arm_controller.set_gripper(int(new_grip), wait=False)
+                current_grip = arm.get_gripper_position() or 400
+            new_grip = current_grip + grip_direction * _GRIP_STEP * speed_scale
+            new_grip = min(_GRIP_RANGE[1], max(_GRIP_RANGE[0], new_grip))
+            arm_controller.set_gripper(int(new_grip), wait=False)
+            # Assume the command takes effect so the next repeat skips the read
+            self._grip_pos_cache = (int(new_grip), now)
             return
 
         # Determine step size based on button hold duration
+        config = app_config
         base_step = (
-            app_config.tap_step_size
-            if duration < app_config.button_hold_threshold
-            else app_config.hold_step_size
+            config.tap_step_size
+            if duration < config.button_hold_threshold
+            else config.hold_step_size
         )
-        speed_scale = self.movement_speed_percent / 100.0
         step = base_step * speed_scale
         rot_step = _ROTATE_STEP_DEG * speed_scale
 
         # Compute tool-frame deltas
-        dx = dy = dz = droll = dpitch = dyaw = 0.0
-        if button_name == "x_pos":
-            dx = -step
-        elif button_name == "x_neg":
-            dx = step
-        elif button_name == "y_pos":
-            dy = step
-        elif button_name == "y_neg":
-            dy = -step
-        elif button_name == "z_pos":
-            dz = step
-        elif button_name == "z_neg":
-            dz = -step
-        elif button_name == "pitch_pos":
-            droll = -rot_step   # pitch → tool X → SDK roll (Rx)
-        elif button_name == "pitch_neg":
-            droll = rot_step
-        elif button_name == "yaw_pos":
-            dpitch = -rot_step  # yaw → tool Y → SDK pitch (Ry)
-        elif button_name == "yaw_neg":
-            dpitch = rot_step
-        elif button_name == "roll_pos":
-            dyaw = rot_step     # roll → tool Z → SDK yaw (Rz)
-        elif button_name == "roll_neg":
-            dyaw = -rot_step
-
-        movement_speed = app_config.movement_speed * speed_scale
-        print(
-            f"Tool-relative move: ({dx:.1f}, {dy:.1f}, {dz:.1f}) "
-            f"rot=({droll:.1f}, {dpitch:.1f}, {dyaw:.1f}) "
-            f"at {self.movement_speed_percent}% speed"
+        deltas = [0.0] * 6
+        axis = _JOG_AXES.get(button_name)
+        if axis is not None:
+            index, sign, rotational = axis
+            deltas[index] = sign * (rot_step if rotational else step)
+        dx, dy, dz, droll, dpitch, dyaw = deltas
+
+        movement_speed = config.movement_speed * speed_scale
+        # Runs on every hold repeat: debug-level with lazy formatting
+        logger.debug(
+            "Tool-relative move: (%.1f, %.1f, %.1f) rot=(%.1f, %.1f, %.1f) at %d%% speed",
+            dx, dy, dz, droll, dpitch, dyaw, speed_percent,
         )
-        self.arm_controller.move_relative_tool(
+        arm_controller.move_relative_tool(
             dx, dy, dz, droll, dpitch, dyaw, speed=movement_speed, wait=False
         )
 
@@ -222,61 +298,88 @@ class ArmControlMixin:
         """Handle arm connection status updates"""
         print(f"Arm connection status: {message}")
 
-        # Update initial loading message if still building UI (don't call page.update during init)
-        if (
-            hasattr(self, "loading_text")
-            and hasattr(self, "_ui_built")
-            and self._ui_built
-        ):
-            if connected:
-                self.loading_text.value = "Arm connected. Building interface..."
-            else:
-                self.loading_text.value = "Arm connection failed. Building interface..."
-            self.page.update()
+        # Connection attempts during startup can report before the UI
+        # exists. Keep the latest status for _build_ui to apply; it is
+        # stored before the check so a build finishing in between still
+        # picks it up
+        if not self._ui_built:
+            self._pending_arm_status = (connected, message)
+            if not self._ui_built:
+                return
+        self._apply_arm_connection_status(connected, message)
+
+    def _apply_arm_connection_status(
+        self: FletMainWindow, connected: bool, message: str
+    ):
+        """Show an arm connection status in the loading text and status bar"""
+        if connected:
+            loading = "Arm connected. Building interface..."
+        else:
+            loading = "Arm connection failed. Building interface..."
+        if self.loading_text.value != loading:
+            self.loading_text.value = loading
+            self._mark(self.loading_text)
 
-        if self.arm_status_text and self._ui_built:
+        if self.arm_status_text:
             if connected:
-                self.arm_status_text.value = f"Arm: \u2713 Connected ({app_config.lite6_ip})"
-                self.arm_status_text.color = "#2E7D32"  # Green 800
+                self._set_status_text(
+                    self.arm_status_text,
+                    f"Arm: \u2713 Connected ({app_config.lite6_ip})",
+                    _STATUS_OK_COLOR,
+                )
             else:
-                self.arm_status_text.value = f"Arm: \u2717 {message}"
-                self.arm_status_text.color = "#C62828"  # Red 800
+                self._set_status_text(
+                    self.arm_status_text, f"Arm: \u2717 {message}", _STATUS_ERROR_COLOR
+                )
             # Update connect button state as well
             try:
                 self._set_connect_button_state(connected, connecting=False)
             except Exception:
                 pass
-            self.page.update()
 
     def _on_arm_error(self: FletMainWindow, error_message: str):
         """Handle arm errors"""
         print(f"Arm error: {error_message}")
         if self.arm_status_text:
-            self.arm_status_text.value = f"Arm Error: {error_message}"
-            self.arm_status_text.color = "#C62828"  # Red 800
-            self.page.update()
+            self._set_status_text(
+                self.arm_status_text, f"Arm Error: {error_message}", _STATUS_ERROR_COLOR
+            )
+
+    def _set_status_text(self: FletMainWindow, text: ft.Text, value: str, color: str) -> bool:
+        """
+        Set a status text's value and color, marking it only if either changed
+
+        Status callbacks often repeat the current state, which then costs
+        no update.
+
+        Returns:
+            True if the control changed
+        """
+        if text.value == value and text.color == color:
+            return False
+        text.value = value
+        text.color = color
+        self._mark(text)
+        return True
 
     def _set_connect_button_state(self: FletMainWindow, connected: bool, connecting: bool = False):
         """Update the connect button text and enabled state."""
-        if not hasattr(self, "arm_connect_btn") or self.arm_connect_btn is None:
+        if self.arm_connect_btn is None:
             return
 
         if connecting:
-            self.arm_connect_btn.text = "Connecting..."
-            self.arm_connect_btn.disabled = True
+            text, disabled = "Connecting...", True
+        elif connected:
+            text, disabled = "Disconnect Arm", False
         else:
-            if connected:
-                self.arm_connect_btn.text = "Disconnect Arm"
-                self.arm_connect_btn.disabled = False
-            else:
-                self.arm_connect_btn.text = "Connect Arm"
-                self.arm_connect_btn.disabled = False
+            text, disabled = "Connect Arm", False
 
-        if self._ui_built:
-            try:
-                self.page.update()
-            except Exception:
-                pass
+        btn = self.arm_connect_btn
+        if btn.text == text and btn.disabled == disabled:
+            return
+        btn.text = text
+        btn.disabled = disabled
+        self._mark(btn)
 
     def _on_connect_arm(self: FletMainWindow, e):
         """Handle Connect/Disconnect button click (runs connect/disconnect in background)."""
@@ -284,6 +387,19 @@ class ArmControlMixin:
             print("Arm controller not available")
             return
 
+        # Drop a connect/disconnect still queued from an earlier click. One
+        # that is already running can't be interrupted, and queueing another
+        # behind it would only repeat the work (and hold up the shared pool)
+        pending = self._pending_connect_future
+        if pending is not None and not pending.done() and not pending.cancel():
+            print("Arm connect/disconnect already in progress")
+            return
+
+        # A later click supersedes this one; its result must not overwrite
+        # the button state the newer click set
+        self._connect_gen += 1
+        gen = self._connect_gen
+
         # If currently connected, disconnect
         try:
             if self.arm_controller.is_connected():
@@ -293,11 +409,12 @@ class ArmControlMixin:
                     try:
                         self.arm_controller.disconnect_arm()
                         print("Disconnected from arm")
-                        self._set_connect_button_state(False)
+                        if gen == self._connect_gen:
+                            self._set_connect_button_state(False)
                     except Exception as ex:
                         print(f"Error during disconnect: {ex}")
 
-                threading.Thread(target=disconnect_thread, daemon=True).start()
+                self._pending_connect_future = self._submit_bg(disconnect_thread)
                 self._set_connect_button_state(False, connecting=False)
                 return
         except Exception:
@@ -312,15 +429,15 @@ class ArmControlMixin:
                 result = self.arm_controller.connect_arm()
                 if result:
                     print("Background connect succeeded")
-                    self._set_connect_button_state(True, connecting=False)
                 else:
                     print("Background connect failed")
-                    self._set_connect_button_state(False, connecting=False)
             except Exception as ex:
                 print(f"Background connect exception: {ex}")
-                self._set_connect_button_state(False, connecting=False)
+                result = False
+            if gen == self._connect_gen:
+                self._set_connect_button_state(bool(result), connecting=False)
 
-        threading.Thread(target=connect_thread, daemon=True).start()
+        self._pending_connect_future = self._submit_bg(connect_thread)
 
     # ------------------------------------------------------------------ #
     #  Scroll-wheel and mode toggle                                        #
@@ -328,43 +445,34 @@ class ArmControlMixin:
 
     def _on_scroll_action(self: FletMainWindow, e):
         """Route scroll wheel to Z-zoom (translate mode) or roll (rotate mode)."""
-        if getattr(self, "control_mode", "translate") == "rotate":
+        if self.control_mode == "rotate":
             self._on_scroll_roll(e)
         else:
             self._on_scroll_zoom(e)
 
+    @_requires_arm()
     def _on_scroll_zoom(self: FletMainWindow, e):
         """Move arm along camera-forward axis (tool X) via scroll wheel."""
-        if not self.arm_controller or not self.arm_controller.arm:
-            return
-        if not self.arm_controller.arm.connected:
-            return
         speed_scale = self.movement_speed_percent / 100.0
         tick = float(np.sign(e.scroll_delta_y))  # normalise to -1, 0, +1
         step = -tick * _SCROLL_STEP_MM * speed_scale
         movement_speed = app_config.movement_speed * speed_scale
-        print(f"Scroll zoom: delta_y={e.scroll_delta_y:.1f} step={step:.1f}mm")
+        logger.debug("Scroll zoom: delta_y=%.1f step=%.1fmm", e.scroll_delta_y, step)
         self.arm_controller.move_relative_tool(dz=step, speed=movement_speed)
 
+    @_requires_arm()
     def _on_scroll_roll(self: FletMainWindow, e):
         """Roll the arm via scroll wheel (rotate mode)."""
-        if not self.arm_controller or not self.arm_controller.arm:
-            return
-        if not self.arm_controller.arm.connected:
-            return
         speed_scale = self.movement_speed_percent / 100.0
         tick = float(np.sign(e.scroll_delta_y))  # normalise to -1, 0, +1
         step = tick * _SCROLL_STEP_DEG * speed_scale
         movement_speed = app_config.movement_speed * speed_scale
-        print(f"Scroll roll: delta_y={e.scroll_delta_y:.1f} step={step:.1f}deg")
+        logger.debug("Scroll roll: delta_y=%.1f step=%.1fdeg", e.scroll_delta_y, step)
         self.arm_controller.move_relative_tool(dyaw=step, speed=movement_speed)  # roll → tool Z → SDK yaw (Rz)
 
     def _on_mode_toggle(self: FletMainWindow):
         """Toggle between translate (pan/zoom) and rotate (pitch/yaw/roll) modes."""
-        import flet as ft
-        from . import _design_tokens as T
-
-        rotating = getattr(self, "control_mode", "translate") == "translate"
+        rotating = self.control_mode == "translate"
         self.control_mode = "rotate" if rotating else "translate"
 
         if rotating:
@@ -437,12 +545,9 @@ class ArmControlMixin:
 
     def _on_click_to_center(self: FletMainWindow, e: ft.TapEvent):
         """Move arm so the clicked point becomes image center (translate mode only)."""
-        if getattr(self, "control_mode", "translate") == "rotate":
+        if self.control_mode == "rotate":
             return  # click disabled in rotate mode
-        if not self.arm_controller or not self.arm_controller.arm:
-            print("Click-to-center: arm not connected")
-            return
-        if not self.arm_controller.arm.connected:
+        if not self._arm_ready:
             print("Click-to-center: arm not connected")
             return
 
@@ -499,9 +604,9 @@ class ArmControlMixin:
         deltas[axis_y] += sign_y * cam_dy_mm
 
         movement_speed = app_config.movement_speed * speed_scale
-        print(
-            f"Click-to-center: pixel({pixel_x:.0f},{pixel_y:.0f}) "
-            f"depth={depth_mm:.0f}mm offset=({cam_dx_mm:.1f},{cam_dy_mm:.1f})mm"
+        logger.debug(
+            "Click-to-center: pixel(%.0f,%.0f) depth=%.0fmm offset=(%.1f,%.1f)mm",
+            pixel_x, pixel_y, depth_mm, cam_dx_mm, cam_dy_mm,
         )
         self.arm_controller.move_relative_tool(
             *deltas, speed=movement_speed, wait=False,
@@ -6,6 +6,11 @@ and RealSense exposure controls including auto-exposure adjustment.
 
 from __future__ import annotations
 
+import asyncio
+import errno
+import os
+import select
+import socket
 import sys
 import time
 from typing import TYPE_CHECKING
@@ -25,6 +30,32 @@ except ImportError:
     DAEMON_AVAILABLE = False
 
 
+# How long a daemon check result is reused before probing the socket again
+_DAEMON_CHECK_TTL_S = 2.0
+
+# Continuous auto-exposure checks this often, backing off (doubling up to
+# the maximum) while adjustments keep failing
+_AUTO_EXPOSURE_INTERVAL_S = 10.0
+_AUTO_EXPOSURE_MAX_INTERVAL_S = 60.0
+
+# Slider drags send at most one exposure command per interval; the value
+# the slider ends on is always sent
+_EXPOSURE_MIN_INTERVAL_S = 0.05
+
+# Exposure bounds (match the slider range)
+_EXPOSURE_MIN = 100
+_EXPOSURE_MAX = 4000
+
+# One-shot auto-exposure aims darker (90 rather than 128) and caps exposure
+# lower: segmentation models prefer clean edges over brightness, and high
+# exposure means more noise
+_STARTUP_TARGET_BRIGHTNESS = 90
+_STARTUP_EXPOSURE_MAX = 2500
+
+# Continuous auto-exposure target (mid-gray)
+_CONTINUOUS_TARGET_BRIGHTNESS = 128
+
+
 class CameraMixin:
     """Mixin that provides camera and exposure control methods for MainWindow."""
 
@@ -32,48 +63,74 @@ class CameraMixin:
         """
         Check if camera daemon is running and responding
 
+        The result is cached for _DAEMON_CHECK_TTL_S, so back-to-back checks
+        (e.g. camera enumeration then image processor start) probe only once.
+
         Returns:
             bool: True if daemon is running and accepting connections, False otherwise
         """
+        now = time.monotonic()
+        if (
+            self._daemon_check_time is not None
+            and now - self._daemon_check_time < _DAEMON_CHECK_TTL_S
+        ):
+            return self._daemon_check_result
+
+        self._daemon_check_result = self._probe_daemon()
+        self._daemon_check_time = now
+        return self._daemon_check_result
+
+    def _probe_daemon(self: FletMainWindow):
+        """Connect to the daemon socket once to see if it is accepting connections"""
         # Daemon is only used on macOS (RealSense requires sudo there)
         # On Windows/Linux, RealSense can be accessed directly
         if sys.platform != "darwin":
-            print("[DEBUG] _check_daemon_running: Not macOS, daemon not needed")
+            print("[DEBUG] _probe_daemon: Not macOS, daemon not needed")
             return False
 
-        print(f"[DEBUG] _check_daemon_running: DAEMON_AVAILABLE={DAEMON_AVAILABLE}")
+        print(f"[DEBUG] _probe_daemon: DAEMON_AVAILABLE={DAEMON_AVAILABLE}")
         if not DAEMON_AVAILABLE:
-            print("[DEBUG] _check_daemon_running: Daemon components not available")
+            print("[DEBUG] _probe_daemon: Daemon components not available")
             return False
 
-        import os
-        import socket
-
         SOCKET_PATH = "/tmp/aaa_camera.sock"
 
         try:
             # Check if socket file exists
             print(
-                f"[DEBUG] _check_daemon_running: Checking for socket at {SOCKET_PATH}..."
+                f"[DEBUG] _probe_daemon: Checking for socket at {SOCKET_PATH}..."
             )
             if not os.path.exists(SOCKET_PATH):
-                print("[DEBUG] _check_daemon_running: Socket not found")
+                print("[DEBUG] _probe_daemon: Socket not found")
                 return False
 
-            # Socket file exists - verify daemon is actually responding
-            print("[DEBUG] _check_daemon_running: Socket found, testing connection...")
+            # Socket file exists - verify daemon is actually responding.
+            # Non-blocking connect, then wait at most 50 ms for it to complete,
+            # so a hung daemon can't stall startup
+            print("[DEBUG] _probe_daemon: Socket found, testing connection...")
             test_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            test_socket.settimeout(1.0)
             try:
-                test_socket.connect(SOCKET_PATH)
+                test_socket.setblocking(False)
+                err = test_socket.connect_ex(SOCKET_PATH)
+                if err in (errno.EINPROGRESS, errno.EAGAIN):
+                    _, writable, _ = select.select([], [test_socket], [], 0.05)
+                    err = (
+                        test_socket.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                        if writable
+                        else errno.ETIMEDOUT
+                    )
+            finally:
                 test_socket.close()
-                print("[DEBUG] _check_daemon_running: Daemon is responding")
+
+            if err == 0:
+                print("[DEBUG] _probe_daemon: Daemon is responding")
                 return True
-            except (ConnectionRefusedError, OSError) as e:
-                print(f"[DEBUG] _check_daemon_running: Daemon not responding: {e}")
-                return False
+            print(
+                f"[DEBUG] _probe_daemon: Daemon not responding: {os.strerror(err)}"
+            )
+            return False
         except Exception as e:
-            print(f"[DEBUG] _check_daemon_running: Error checking daemon - {e}")
+            print(f"[DEBUG] _probe_daemon: Error checking daemon - {e}")
             return False
 
     def _on_camera_changed(self: FletMainWindow, e):
@@ -197,13 +254,16 @@ class CameraMixin:
         if self.image_processor:
             self.image_processor.toggle_flip()
             # Update button appearance to show flip state
+            prev_bgcolor = self.flip_camera_btn.bgcolor
             if self.image_processor.flip_horizontal:
                 self.flip_camera_btn.bgcolor = "#4CAF50"  # Green 500 when enabled
                 self.flip_camera_btn.icon_color = "#FFFFFF"  # White icon
             else:
                 self.flip_camera_btn.bgcolor = "#E0E0E0"  # Grey 300 when disabled
                 self.flip_camera_btn.icon_color = "#424242"  # Grey 800
-            self.page.update()
+            # The daemon processor never flips, so the toggle can be a no-op
+            if self.flip_camera_btn.bgcolor != prev_bgcolor:
+                self._mark(self.flip_camera_btn)
 
     def _on_toggle_depth_view(self: FletMainWindow):
         """Toggle between RGB and depth visualization"""
@@ -218,7 +278,7 @@ class CameraMixin:
                 self.depth_toggle_btn.bgcolor = "#E0E0E0"  # Grey 300 when showing RGB
                 self.depth_toggle_btn.icon_color = "#424242"  # Grey 800
                 self.depth_toggle_btn.tooltip = "Showing RGB view (click for Depth)"
-            self.page.update()
+            self._mark(self.depth_toggle_btn)
 
     def _on_exposure_change(self: FletMainWindow, e):
         """Handle RealSense exposure slider change"""
@@ -228,12 +288,37 @@ class CameraMixin:
         exposure_value = int(e.control.value)
         self.exposure_value_text.value = f"Exposure: {exposure_value}"
 
-        # Update RealSense camera exposure
+        # The slider itself is already current on the client
+        self._mark(self.exposure_value_text)
+
+        # Update RealSense camera exposure: right away if the last command
+        # went out long enough ago, otherwise once the interval has passed
+        # (with whatever value the slider has reached by then)
+        self._exposure_pending = exposure_value
+        if self._exposure_send_scheduled:
+            return
+        wait = _EXPOSURE_MIN_INTERVAL_S - (time.monotonic() - self._exposure_last_sent)
+        if wait <= 0:
+            self._send_pending_exposure()
+        else:
+            self._exposure_send_scheduled = True
+            self.page.run_task(self._send_pending_exposure_after, wait)
+
+    async def _send_pending_exposure_after(self: FletMainWindow, delay: float):
+        """Send the latest slider exposure once delay has passed"""
+        await asyncio.sleep(delay)
+        self._exposure_send_scheduled = False
+        await asyncio.to_thread(self._send_pending_exposure)
+
+    def _send_pending_exposure(self: FletMainWindow):
+        """Send the latest slider exposure value to the camera"""
+        exposure_value, self._exposure_pending = self._exposure_pending, None
+        if exposure_value is None or not self.image_processor:
+            return
+        self._exposure_last_sent = time.monotonic()
         if self.image_processor.set_realsense_exposure(exposure_value):
             print(f"\u2713 RealSense exposure set to {exposure_value}")
 
-        self.page.update()
-
     def _auto_adjust_exposure(self: FletMainWindow):
         """Run auto-exposure adjustment once"""
         if not self.using_realsense or not self.image_processor:
@@ -256,14 +341,14 @@ class CameraMixin:
 
             # Calculate optimal exposure
             current_exposure = int(self.exposure_slider.value)
-            # Target: 90 (lower than 128) for better noise/clarity tradeoff
-            # Segmentation models prioritize clean edges over brightness
-            target_brightness = 90
-            brightness_ratio = target_brightness / max(avg_brightness, 1)
+            brightness_ratio = _STARTUP_TARGET_BRIGHTNESS / max(avg_brightness, 1)
             new_exposure = int(current_exposure * brightness_ratio)
 
-            # Clamp with max 2500 to avoid excessive noise (high exposure = worse segmentation)
-            new_exposure = max(100, min(2500, new_exposure))
+            # Clamp (lower cap than the slider to avoid excessive noise)
+            if new_exposure < _EXPOSURE_MIN:
+                new_exposure = _EXPOSURE_MIN
+            elif new_exposure > _STARTUP_EXPOSURE_MAX:
+                new_exposure = _STARTUP_EXPOSURE_MAX
 
             print(
                 f"Startup auto-exposure: brightness={avg_brightness:.1f}, {current_exposure} \u2192 {new_exposure}"
@@ -279,45 +364,40 @@ class CameraMixin:
                     f"   (Wait ~2 seconds for camera to adjust and buffer to refill before clicking auto-exposure again)"
                 )
 
-            self.page.update()
+            self._mark(self.exposure_slider, self.exposure_value_text)
 
         except Exception as e:
             print(f"Startup auto-exposure failed: {e}")
 
-    def _continuous_auto_exposure(self: FletMainWindow):
-        """Continuously adjust exposure until disabled"""
+    async def _continuous_auto_exposure(self: FletMainWindow):
+        """
+        Continuously adjust exposure until disabled
+
+        Runs as a page task (page.run_task) so it holds no thread while
+        waiting between checks.
+        """
+        interval = _AUTO_EXPOSURE_INTERVAL_S
         while self.auto_exposure_enabled:
             try:
-                # Get current frame brightness
-                if hasattr(self.image_processor, "get_recent_brightness"):
-                    avg_brightness = self.image_processor.get_recent_brightness()
-                else:
-                    # Fallback: analyze current displayed frame
-                    if self.video_feed.src_base64:
-                        import base64
-                        from io import BytesIO
-
-                        import numpy as np
-                        from PIL import Image
-
-                        img_data = base64.b64decode(
-                            self.video_feed.src_base64.split(",")[1]
-                        )
-                        img = Image.open(BytesIO(img_data))
-                        img_array = np.array(img.convert("RGB"))
-                        avg_brightness = np.mean(img_array)
-                    else:
-                        time.sleep(10)
-                        continue
+                # Get current frame brightness (sampled by the processor
+                # as frames arrive; nothing to decode here)
+                if not hasattr(self.image_processor, "get_recent_brightness"):
+                    await asyncio.sleep(interval)
+                    continue
+                avg_brightness = self.image_processor.get_recent_brightness()
 
                 # Calculate optimal exposure
                 current_exposure = int(self.exposure_slider.value)
-                target_brightness = 128
-                brightness_ratio = target_brightness / max(avg_brightness, 1)
+                brightness_ratio = _CONTINUOUS_TARGET_BRIGHTNESS / max(
+                    avg_brightness, 1
+                )
                 new_exposure = int(current_exposure * brightness_ratio)
 
                 # Clamp to slider range
-                new_exposure = max(100, min(4000, new_exposure))
+                if new_exposure < _EXPOSURE_MIN:
+                    new_exposure = _EXPOSURE_MIN
+                elif new_exposure > _EXPOSURE_MAX:
+                    new_exposure = _EXPOSURE_MAX
 
                 # Only adjust if change is significant (>5%)
                 if abs(new_exposure - current_exposure) / current_exposure > 0.05:
@@ -329,14 +409,18 @@ class CameraMixin:
                     self.exposure_slider.value = new_exposure
                     self.exposure_value_text.value = f"Exposure: {new_exposure}"
 
-                    if self.image_processor.set_realsense_exposure(new_exposure):
-                        pass  # Success
+                    # Sends a command to the camera (daemon socket)
+                    await asyncio.to_thread(
+                        self.image_processor.set_realsense_exposure, new_exposure
+                    )
 
-                    self.page.update()
+                    self._mark(self.exposure_slider, self.exposure_value_text)
 
-                # Wait 10 seconds before next check (sporadic to improve responsiveness)
-                time.sleep(10)
+                interval = _AUTO_EXPOSURE_INTERVAL_S
 
             except Exception as e:
                 print(f"Auto-exposure error: {e}")
-                time.sleep(10)
+                interval = min(interval * 2, _AUTO_EXPOSURE_MAX_INTERVAL_S)
+
+            # Sporadic checks keep the camera responsive
+            await asyncio.sleep(interval)
@@ -11,37 +11,69 @@ import cv2
 import numpy as np
 import flet as ft
 
+from . import _design_tokens as T
+from ._label_layout import needs_leader_line
+from ._overlay_blend import blend_contour
+
 if TYPE_CHECKING:
     from .main_window import FletMainWindow
 
 logger = logging.getLogger(__name__)
 
+# Object buttons are pre-built once and reused across Find Objects runs
+_OBJECT_BUTTON_POOL_SIZE = 16
+
+# Masked frames kept per freeze (one per selection state: all / one object)
+_FROZEN_MASK_CACHE_SIZE = 4
+
+# Without depth fusion, Find Objects freezes once this many object
+# detections have run since the click (so the frozen labels are fresh)
+_FREEZE_AFTER_DETECTIONS = 3
+
 
 class ObjectDetectionMixin:
     """Methods for object detection UI, selection, 3D analysis, and visualization."""
 
+    def _make_object_button(self: FletMainWindow, index: int):
+        """Create one pooled object button bound to detection index"""
+        return ft.ElevatedButton(
+            text="",
+            on_click=lambda e, idx=index: self._on_object_selected(idx),
+            bgcolor=ft.Colors.BLUE_GREY_800,
+            color=ft.Colors.WHITE,
+            visible=False,
+        )
+
+    def _build_object_button_pool(self: FletMainWindow):
+        """Pre-allocate object buttons once; detections only toggle/relabel them"""
+        self._object_button_pool = [
+            self._make_object_button(i) for i in range(_OBJECT_BUTTON_POOL_SIZE)
+        ]
+        self.object_buttons_row.controls = self._object_button_pool
+
     def _create_object_buttons(self: FletMainWindow):
-        """Create clickable buttons for each detected object"""
+        """Show a pooled button for each detected object"""
         if not self.frozen_detections:
             return
 
-        # Clear existing buttons
-        self.object_buttons_row.controls.clear()
-
-        # Create a button for each detected object
         classes = self.frozen_detections["classes"]
-        for i, class_name in enumerate(classes, start=1):
-            btn = ft.ElevatedButton(
-                text=f"#{i}: {class_name}",
-                on_click=lambda e, idx=i - 1: self._on_object_selected(idx),
-                bgcolor=ft.Colors.BLUE_GREY_800,
-                color=ft.Colors.WHITE,
-            )
-            self.object_buttons_row.controls.append(btn)
+
+        # Grow the pool in the rare case of more detections than buttons
+        pool = self._object_button_pool
+        while len(pool) < len(classes):
+            pool.append(self._make_object_button(len(pool)))
+
+        for i, btn in enumerate(pool):
+            if i < len(classes):
+                btn.text = f"#{i + 1}: {classes[i]}"
+                btn.bgcolor = ft.Colors.BLUE_GREY_800
+                btn.visible = True
+            else:
+                btn.visible = False
 
         # Show the button row
         self.object_buttons_row.visible = True
-        self.page.update()
+        self._mark(self.object_buttons_row)
 
     def _on_object_selected(self: FletMainWindow, object_index: int):
         """Handle object button click - toggle selection if already selected"""
@@ -199,6 +231,7 @@ class ObjectDetectionMixin:
                         btn = self.object_buttons_row.controls[object_index]
                         btn.text = f"{class_name} \u2713"
                         btn.bgcolor = ft.Colors.GREEN_700
+                        self._mark(btn)
                 except Exception:
                     pass
                 # Update grasp info card if on grasp preview screen
@@ -206,8 +239,8 @@ class ObjectDetectionMixin:
                     self._update_grasp_info_card()
                 except Exception:
                     pass
+                # The new highlight goes out with the next frame push
                 self._update_frozen_frame_highlight()
-                self.page.update()
 
         except Exception as e:
             self._analysis_in_progress = False
@@ -224,7 +257,7 @@ class ObjectDetectionMixin:
                     btn = self.object_buttons_row.controls[object_index]
                     btn.text = f"{classes[object_index]} (analysis failed)"
                     btn.bgcolor = ft.Colors.GREEN_700
-                    self.page.update()
+                    self._mark(btn)
                 except Exception:
                     pass
 
@@ -439,6 +472,24 @@ class ObjectDetectionMixin:
             h = dims.get("height", 0) * 1000
             return f"~{bw:.0f} \u00d7 {d:.0f} \u00d7 {h:.0f}mm"
 
+    def _frozen_overlay_cache(self: FletMainWindow):
+        """
+        Label positions and masked frames for the current freeze
+
+        Selecting or hovering an object doesn't move labels or change the
+        masks of a given selection, so both are computed once per freeze and
+        reused. The cache is rebuilt when frozen_detections is replaced.
+        """
+        cache = self._frozen_overlay
+        if cache is None or cache["detections"] is not self.frozen_detections:
+            cache = {
+                "detections": self.frozen_detections,
+                "label_positions": None,
+                "masks": {},  # selected indices (or None) -> (image, colors)
+            }
+            self._frozen_overlay = cache
+        return cache
+
     def _update_frozen_frame_highlight(self: FletMainWindow):
         """Redraw frozen frame with selected object highlighted"""
         if not self.frozen_detections:
@@ -453,14 +504,12 @@ class ObjectDetectionMixin:
         if self.frozen_raw_frame is None:
             return
 
-        clean_img = self.frozen_raw_frame.copy()
         boxes = self.frozen_detections["boxes"]
         classes = self.frozen_detections["classes"]
         contours = self.frozen_detections["contours"]
         centers = self.frozen_detections["centers"]
 
         # Use CARD_COLORS_BGR so camera masks match the card badge colors
-        from . import _design_tokens as T
 
         # Determine which objects to highlight
         # Priority: selected > hovered > all
@@ -472,35 +521,50 @@ class ObjectDetectionMixin:
         else:
             selected_indices = None
 
-        # Draw masks and get colors
-        img_with_masks, mask_colors = detection_mgr.segmentation_model.draw_object_mask(
-            clean_img,
-            boxes,
-            classes,
-            contours,
-            return_colors=True,
-            selected_indices=selected_indices,
-            colors=T.CARD_COLORS_BGR,
-        )
+        # Draw masks and get colors (cached per selection for this freeze)
+        cache = self._frozen_overlay_cache()
+        mask_key = tuple(selected_indices) if selected_indices else None
+        masked = cache["masks"].get(mask_key)
+        if masked is None:
+            # draw_object_mask draws on its own copy, so the frozen frame is
+            # passed as is
+            masked = detection_mgr.segmentation_model.draw_object_mask(
+                self.frozen_raw_frame,
+                boxes,
+                classes,
+                contours,
+                return_colors=True,
+                selected_indices=selected_indices,
+                colors=T.CARD_COLORS_BGR,
+            )
+            if len(cache["masks"]) >= _FROZEN_MASK_CACHE_SIZE:
+                cache["masks"].pop(next(iter(cache["masks"])))
+            cache["masks"][mask_key] = masked
+        img_with_masks = masked[0].copy()
+        mask_colors = masked[1]
 
         # If hovering (no selection), redraw hovered object's mask with stronger emphasis
         if self.selected_object is None and hovered is not None and hovered < len(contours):
-            hover_overlay = img_with_masks.copy()
             hover_color = mask_colors[hovered]
-            cv2.fillPoly(hover_overlay, [contours[hovered]], hover_color)
-            # Blend with higher alpha for emphasis
-            img_with_masks = cv2.addWeighted(img_with_masks, 0.6, hover_overlay, 0.4, 0)
+            # Blend with higher alpha for emphasis (only inside the object's box)
+            blend_contour(img_with_masks, contours[hovered], hover_color, 0.4)
             # Thicker contour for hovered object
             cv2.drawContours(img_with_masks, [contours[hovered]], -1, hover_color, 4)
 
-        # Calculate label positions with overlap avoidance
-        label_positions = self._calculate_label_positions(
-            centers, classes, img_with_masks.shape
-        )
+        # Calculate label positions with overlap avoidance (once per freeze)
+        label_positions = cache["label_positions"]
+        if label_positions is None:
+            label_positions = self._calculate_label_positions(
+                centers, classes, img_with_masks.shape
+            )
+            cache["label_positions"] = label_positions
+
+        # Which labels moved far enough to need a connector (all at once)
+        leaders = needs_leader_line(centers, label_positions)
 
         # Draw numbered labels with highlighting for selected/hovered object
-        for i, (center, class_name, label_pos, mask_color) in enumerate(
-            zip(centers, classes, label_positions, mask_colors), start=1
+        for i, (center, class_name, label_pos, mask_color, leader) in enumerate(
+            zip(centers, classes, label_positions, mask_colors, leaders), start=1
         ):
             idx = i - 1
             # Skip this label if an object is selected and this isn't it
@@ -521,8 +585,7 @@ class ObjectDetectionMixin:
             mask_color_rgb = (mask_color[2], mask_color[1], mask_color[0])
 
             # Draw connector line if label moved significantly
-            distance = np.sqrt((label_x - x) ** 2 + (label_y - y) ** 2)
-            if distance > 30:
+            if leader:
                 line_thickness = 3 if (is_selected or is_hovered) else 2
                 cv2.line(
                     img_with_masks,
@@ -548,8 +611,8 @@ class ObjectDetectionMixin:
                 bg_color = (255, 255, 255)  # White background
                 border_color = mask_color_rgb  # Card color border
 
-            # Draw using PIL for professional font rendering
-            img_with_masks = self._draw_text_pil(
+            # Draw with the TrueType glyph atlas for professional font rendering
+            img_with_masks = self._draw_label(
                 img_with_masks,
                 label,
                 (label_x, label_y),
@@ -644,7 +707,8 @@ class ObjectDetectionMixin:
 
     def _clear_object_buttons(self: FletMainWindow):
         """Clear object selection buttons when unfreezing"""
-        self.object_buttons_row.controls.clear()
+        for btn in self._object_button_pool:
+            btn.visible = False
         self.object_buttons_row.visible = False
         self.selected_object = None
         self.object_analysis = None
@@ -670,11 +734,10 @@ class ObjectDetectionMixin:
                 self.image_processor.set_detection_mode("objects")
                 self._update_status()
 
-            threading.Thread(
-                target=self._capture_and_freeze_with_fusion,
-                args=("Find Objects: Video frozen on detected objects",),
-                daemon=True,
-            ).start()
+            self._submit_bg(
+                self._capture_and_freeze_with_fusion,
+                "Find Objects: Video frozen on detected objects",
+            )
         else:
             # Second click: unfreeze and capture for 1 second, then freeze again
             print("Find Objects: Capturing new frame...")
@@ -682,11 +745,10 @@ class ObjectDetectionMixin:
             self.frozen_frame = None
             self._clear_object_buttons()
 
-            threading.Thread(
-                target=self._capture_and_freeze_with_fusion,
-                args=("Find Objects: Video frozen on new frame",),
-                daemon=True,
-            ).start()
+            self._submit_bg(
+                self._capture_and_freeze_with_fusion,
+                "Find Objects: Video frozen on new frame",
+            )
 
     def _capture_and_freeze_with_fusion(
         self: FletMainWindow,
@@ -701,6 +763,9 @@ class ObjectDetectionMixin:
         """
         from aaa_vision.depth_fusion import capture_and_fuse
 
+        detection_mgr = self.image_processor.detection_manager
+        start_count = detection_mgr.object_detection_count
+
         fused_pcd = None
         if getattr(self.image_processor, "use_realsense", False):
             try:
@@ -713,8 +778,11 @@ class ObjectDetectionMixin:
                 print(f"Find Objects: TSDF fusion failed, falling back: {ex}")
                 fused_pcd = None
         else:
-            # Non-RealSense path: just wait so behavior matches the old freeze
-            time.sleep(duration_sec)
+            # Non-RealSense path: nothing to fuse, so freeze as soon as a few
+            # object detections have come through (duration_sec at most)
+            detection_mgr.wait_for_object_detections(
+                start_count + _FREEZE_AFTER_DETECTIONS, timeout=duration_sec
+            )
 
         # Snapshot single-frame data for the legacy fallback paths
         try:
@@ -760,8 +828,6 @@ class ObjectDetectionMixin:
         duration: seconds to display overlay before clearing
         switch_to_depth: if True, temporarily switch display to depth visualization while overlay is shown
         """
-        import threading
-
         if object_index is None:
             return
 
@@ -786,8 +852,7 @@ class ObjectDetectionMixin:
                         self.depth_toggle_btn.tooltip = (
                             "Showing Depth view (click for RGB)"
                         )
-                        if self._ui_built:
-                            self.page.update()
+                        self._mark(self.depth_toggle_btn)
                     except Exception:
                         prev_depth_view = None
         except Exception:
@@ -802,21 +867,17 @@ class ObjectDetectionMixin:
         self._overlay_points = points
         try:
             self._update_frozen_frame_highlight()
-            if self._ui_built:
-                self.page.update()
+            self._update_video_feed(self.frozen_frame)
         except Exception:
             pass
 
         # Clear overlay after duration in background thread and optionally restore depth view
         def clear_overlay():
-            import time
-
             time.sleep(duration)
             self._overlay_points = None
             try:
                 self._update_frozen_frame_highlight()
-                if self._ui_built:
-                    self.page.update()
+                self._update_video_feed(self.frozen_frame)
             except Exception:
                 pass
 
@@ -833,8 +894,7 @@ class ObjectDetectionMixin:
                     self.depth_toggle_btn.bgcolor = "#E0E0E0"
                     self.depth_toggle_btn.icon_color = "#424242"
                     self.depth_toggle_btn.tooltip = "Showing RGB view (click for Depth)"
-                    if self._ui_built:
-                        self.page.update()
+                    self._mark(self.depth_toggle_btn)
             except Exception:
                 pass
 
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import os
+import time
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+import cv2
+import numpy as np
+
 if TYPE_CHECKING:
     from .main_window import FletMainWindow
 
@@ -18,8 +24,6 @@ class PointCloudMixin:
         Detects (px, py, depth_mm) format by checking coordinate ranges and
         deprojects using default D435 color intrinsics (1920x1080).
         """
-        import numpy as np
-
         if len(arr) == 0 or arr.shape[1] != 3:
             return arr
         # Heuristic: pixel coords have X > 50 and Z (depth_mm) > 50
@@ -38,9 +42,6 @@ class PointCloudMixin:
         self: FletMainWindow, object_index: int, subsample: int = 4, to_meters: bool = False
     ):
         """Return list of (x, y, depth_mm) or (X, Y, Z) if to_meters and RealSense available for selected frozen object."""
-        import cv2
-        import numpy as np
-
         if not getattr(self, "frozen_detections", None):
             return []
 
@@ -202,9 +203,6 @@ class PointCloudMixin:
         Returns Nx3 uint8 array matching the points from get_object_depth_points,
         or None if color data is unavailable.
         """
-        import cv2
-        import numpy as np
-
         if not getattr(self, "frozen_detections", None):
             return None
 
@@ -257,9 +255,6 @@ class PointCloudMixin:
 
     def get_object_mask_pixels(self: FletMainWindow, object_index: int, subsample: int = 8):
         """Return list of (x, y, depth_mm or 0 if unavailable) in RGB image coordinates for the object mask."""
-        import cv2
-        import numpy as np
-
         if not getattr(self, "frozen_detections", None):
             return []
 
@@ -313,11 +308,6 @@ class PointCloudMixin:
 
     def _export_selected_object_ply(self: FletMainWindow, e=None, subsample: int = 4):
         """Export selected object's point cloud to PLY with RGB colors."""
-        import time
-        from pathlib import Path
-
-        import numpy as np
-
         if self.selected_object is None:
             print("No object selected to export")
             return
@@ -334,8 +324,6 @@ class PointCloudMixin:
             self._show_point_overlay(
                 self.selected_object, subsample=max(1, subsample), duration=1.5
             )
-            import time
-
             time.sleep(1.0)
         except Exception as ex:
             print(f"Overlay failed: {ex}")
@@ -382,7 +370,7 @@ class PointCloudMixin:
 
             if hasattr(self, "status_text"):
                 self.status_text.value = f"PLY saved: {out_path.name}"
-                self.page.update()
+                self._mark(self.status_text)
             return str(out_path)
         except Exception as ex:
             print(f"Failed to save PLY: {ex}")
@@ -392,11 +380,6 @@ class PointCloudMixin:
         self: FletMainWindow, e=None, subsample: int = 2, method: str = "poisson"
     ):
         """Export selected object as a reconstructed 3D mesh PLY file."""
-        import time
-        from pathlib import Path
-
-        import numpy as np
-
         if self.selected_object is None:
             print("No object selected to export")
             return None
@@ -443,7 +426,6 @@ class PointCloudMixin:
 
         # Reconstruct mesh (suppress C++ stderr noise from Poisson solver)
         print(f"Reconstructing mesh ({method}) from {len(pcd.points)} points...")
-        import os
         stderr_fd = os.dup(2)
         devnull = os.open(os.devnull, os.O_WRONLY)
         os.dup2(devnull, 2)
@@ -471,7 +453,7 @@ class PointCloudMixin:
             self.last_exported_ply = str(out_path)
             if hasattr(self, "status_text"):
                 self.status_text.value = f"Mesh saved: {out_path.name} ({n_verts}v, {n_tris}t)"
-                self.page.update()
+                self._mark(self.status_text)
             return str(out_path)
         except Exception as ex:
             print(f"Failed to save mesh: {ex}")
@@ -486,11 +468,6 @@ class PointCloudMixin:
         primitive mesh (sphere/cylinder/box) or mirrors the observed surface
         for irregular objects.
         """
-        import time
-        from pathlib import Path
-
-        import numpy as np
-
         if self.selected_object is None:
             print("No object selected to export")
             return None
@@ -549,7 +526,6 @@ class PointCloudMixin:
 
         # Generate completed mesh (suppress C++ stderr noise from Poisson solver)
         print(f"Generating complete {shape.shape_type} mesh...")
-        import os
         stderr_fd = os.dup(2)
         devnull = os.open(os.devnull, os.O_WRONLY)
         os.dup2(devnull, 2)
@@ -592,7 +568,7 @@ class PointCloudMixin:
                     f"Completed {shape.shape_type}: {out_path.name} "
                     f"({n_verts}v, {n_tris}t)"
                 )
-                self.page.update()
+                self._mark(self.status_text)
             return str(out_path)
         except Exception as ex:
             print(f"Failed to save completed mesh: {ex}")
@@ -600,10 +576,8 @@ class PointCloudMixin:
 
     def _preview_selected_object_ply(self: FletMainWindow, e=None):
         """Preview the last exported PLY file using view_pointcloud.py as a subprocess."""
-        import os
         import subprocess
         import sys
-        from pathlib import Path
 
         # Ensure there is an exported file; try to export if not present
         if not getattr(self, "last_exported_ply", None):
@@ -645,6 +619,6 @@ class PointCloudMixin:
             print(f"Launching Cloudview for: {path}")
             if hasattr(self, "status_text"):
                 self.status_text.value = f"Previewing: {Path(path).name}"
-                self.page.update()
+                self._mark(self.status_text)
         except Exception as ex:
             print(f"Failed to launch Cloudview: {ex}")
@@ -2,17 +2,134 @@
 
 from __future__ import annotations
 
-import base64
-from io import BytesIO
+import logging
+import threading
+import time
+from binascii import b2a_base64
 from typing import TYPE_CHECKING
 
 import cv2
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
+from aaa_core.config.settings import app_config
+
+from ._glyph_atlas import blend_alpha_mask, get_glyph_atlas
+from ._label_layout import needs_leader_line, solve_label_layout
+
+# libjpeg-turbo via PyTurboJPEG (optional, "accel" extra): encodes RGB
+# directly, so the per-frame RGB->BGR conversion for OpenCV is skipped
+try:
+    from turbojpeg import TJPF_RGB, TJSAMP_420, TurboJPEG
+
+    _TURBOJPEG = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _TURBOJPEG = None
+
+# SIMD base64 via pybase64 (optional, "accel" extra); binascii otherwise
+try:
+    from pybase64 import b64encode_as_string as _b64encode_str
+except ImportError:
+
+    def _b64encode_str(data) -> str:
+        return b2a_base64(data, newline=False).decode("ascii")
 
 if TYPE_CHECKING:
     from .main_window import FletMainWindow
 
+logger = logging.getLogger(__name__)
+
+# How often the UI push thread reports frames it had to skip
+_DROPPED_REPORT_INTERVAL_S = 1.0
+
+# Longest the UI push thread waits for a frame before flushing dirty controls
+_UI_TICK_S = 1 / 30
+
+# Video frames are pushed to Flet at most this often; faster cameras
+# coalesce in the frame slot instead of each costing a page update
+_MIN_PUSH_INTERVAL_S = 1 / 30
+
+# Preview JPEG settings (skip the optimize pass - it costs more than it saves).
+# Baseline (non-progressive) scan and 4:2:0 chroma are pinned explicitly so
+# both encoders produce the same small single-pass stream. A separate lower
+# chroma quality is not used: OpenCV's luma/chroma quality path made frames
+# larger, not smaller.
+_JPEG_QUALITY = 80
+_JPEG_PARAMS = [
+    cv2.IMWRITE_JPEG_QUALITY, _JPEG_QUALITY,
+    cv2.IMWRITE_JPEG_OPTIMIZE, 0,
+    cv2.IMWRITE_JPEG_PROGRESSIVE, 0,
+    cv2.IMWRITE_JPEG_SAMPLING_FACTOR, cv2.IMWRITE_JPEG_SAMPLING_FACTOR_420,
+]
+
+# Adaptive preview quality: the quality steps down while the smoothed
+# encode + push time exceeds the budget and back up once there is clear
+# headroom, so slow machines keep their frame cadence
+_JPEG_QUALITY_MIN = 60
+_JPEG_QUALITY_MAX = 90
+_JPEG_QUALITY_STEP = 5
+_PUSH_BUDGET_S = _MIN_PUSH_INTERVAL_S / 2
+_PUSH_HEADROOM = 0.6  # Raise quality below this fraction of the budget
+_PUSH_EMA_ALPHA = 0.1
+
+# Frame the video feed starts with, in the loading placeholder's color
+# (#1A2327, BGR for OpenCV), so the Image always has a valid source
+# before the first camera frame arrives
+_PLACEHOLDER_JPEG_B64 = _b64encode_str(
+    cv2.imencode(".jpg", np.full((2, 2, 3), (39, 35, 26), dtype=np.uint8))[1]
+)
+
+
+# BGR scratch frame for the OpenCV encode path. Only the UI push thread
+# encodes, so one buffer (reallocated when the preview size changes) is
+# reused instead of allocating a full frame per encode
+_bgr_scratch = None
+
+
+def _encode_preview_jpeg(img_rgb, quality=_JPEG_QUALITY):
+    """
+    JPEG-encode a contiguous RGB frame for the video feed
+
+    Args:
+        img_rgb: Contiguous RGB uint8 array
+        quality: JPEG quality (0-100)
+
+    Returns:
+        Encoded bytes-like object, or None if encoding failed
+    """
+    global _bgr_scratch
+
+    if _TURBOJPEG is not None:
+        return _TURBOJPEG.encode(
+            img_rgb,
+            quality=quality,
+            pixel_format=TJPF_RGB,
+            jpeg_subsample=TJSAMP_420,
+        )
+    # OpenCV encodes BGR
+    if _bgr_scratch is None or _bgr_scratch.shape != img_rgb.shape:
+        _bgr_scratch = np.empty_like(img_rgb)
+    cv2.cvtColor(img_rgb, cv2.COLOR_RGB2BGR, dst=_bgr_scratch)
+    params = _JPEG_PARAMS
+    if quality != _JPEG_QUALITY:
+        params = params.copy()
+        params[1] = quality
+    ok, jpeg = cv2.imencode(".jpg", _bgr_scratch, params)
+    return jpeg if ok else None
+
+
+def _fill_rounded_rect(img, rect, radius, color):
+    """Fill a rounded rectangle (x1, y1, x2, y2 inclusive) with anti-aliased corners"""
+    x1, y1, x2, y2 = (int(v) for v in rect)
+    if x2 <= x1 or y2 <= y1:
+        return
+    r = int(min(radius, (x2 - x1) // 2, (y2 - y1) // 2))
+    color = tuple(int(c) for c in color)
+    cv2.rectangle(img, (x1 + r, y1), (x2 - r, y2), color, -1)
+    cv2.rectangle(img, (x1, y1 + r), (x2, y2 - r), color, -1)
+    if r > 0:
+        corners = ((x1 + r, y1 + r), (x2 - r, y1 + r), (x1 + r, y2 - r), (x2 - r, y2 - r))
+        for center in corners:
+            cv2.circle(img, center, r, color, -1, cv2.LINE_AA)
+
 
 class VideoDisplayMixin:
     """Mixin providing video feed display and label rendering methods."""
@@ -29,44 +146,220 @@ class VideoDisplayMixin:
             if self.video_frozen:
                 if self.frozen_frame is None:
                     # First frame after freezing - store raw frame and enhance labels
-                    # Store the raw frame at freeze time for later re-highlighting
-                    if hasattr(self.image_processor, "_last_rgb_frame"):
-                        self.frozen_raw_frame = (
-                            self.image_processor._last_rgb_frame.copy()
-                        )
-
+                    # Store the raw frame at freeze time for later re-highlighting.
+                    # The processor publishes (frame, frame_id) as one tuple and
+                    # replaces it each frame rather than writing into the
+                    # array, so one read gives a matching pair and keeping a
+                    # reference is enough
+                    last_rgb = getattr(self.image_processor, "_last_rgb", None)
+                    if last_rgb is not None:
+                        self.frozen_raw_frame = last_rgb[0]
+
+                    # _enhance_frozen_labels copies whatever it draws on
                     self.frozen_frame, self.frozen_detections = (
-                        self._enhance_frozen_labels(img_array.copy())
+                        self._enhance_frozen_labels(img_array, last_rgb)
                     )
                     self._create_object_buttons()
                     self._populate_object_cards()
                     print("Find Objects: Frame captured and frozen")
-                # Display the frozen frame
+                # Display the frozen frame. It only changes when it is
+                # reassigned (new highlight) or the preview size is reset, so
+                # skip re-encoding the same image for every camera frame
                 img_array = self.frozen_frame
+                shown = self._shown_frozen
+                if (
+                    shown is not None
+                    and shown[0] is img_array
+                    and shown[1] is self._preview_size
+                ):
+                    return
+
+            # Hand the raw frame to the UI push thread (never blocks on Flet).
+            # Downscale and JPEG encode happen there, so the processor thread
+            # goes straight back to the camera and frames the UI skips are
+            # never encoded at all
+            self._publish_frame(img_array)
+            self._shown_frozen = (
+                (img_array, self._preview_size) if self.video_frozen else None
+            )
 
-            # Image is already in RGB format from image_processor
-            # Convert to PIL Image
-            pil_image = Image.fromarray(img_array)
+        except Exception as e:
+            print(f"Error updating video feed: {e}")
 
-            # Convert to base64
-            buffered = BytesIO()
-            pil_image.save(buffered, format="JPEG", quality=85)
-            img_base64 = base64.b64encode(buffered.getvalue()).decode()
+    def _encode_preview(self: FletMainWindow, img_array):
+        """
+        Downscale and JPEG-encode a frame for the video feed
 
-            # Update Flet image
-            self.video_feed.src_base64 = img_base64
+        Args:
+            img_array: Numpy array (RGB format from image processor)
 
-            # Hide loading placeholder on first frame
-            if not self._first_frame_received:
-                self.loading_placeholder.visible = False
-                self._first_frame_received = True
+        Returns:
+            Base64-encoded JPEG string, or None if encoding failed
+        """
+        # Shrink to what the screen can show before paying for the encode
+        # (frozen_raw_frame keeps full resolution for detection)
+        img_array = self._downscale_for_preview(img_array)
 
-            self.page.update()
+        # Only copy when handed a non-contiguous view (e.g. a flipped slice)
+        if not img_array.flags["C_CONTIGUOUS"]:
+            img_array = np.ascontiguousarray(img_array)
 
-        except Exception as e:
-            print(f"Error updating video feed: {e}")
+        # Encode straight from the array (no PIL / BytesIO round-trip)
+        jpeg = _encode_preview_jpeg(img_array, self._jpeg_quality)
+        if jpeg is None:
+            return None
+        return _b64encode_str(jpeg)
+
+    def _adapt_jpeg_quality(self: FletMainWindow, push_s: float):
+        """
+        Step the preview JPEG quality toward the push-time budget
+
+        Args:
+            push_s: Seconds the last frame took to encode and push
+        """
+        ema = self._push_time_ema
+        ema = push_s if ema is None else ema + _PUSH_EMA_ALPHA * (push_s - ema)
+        self._push_time_ema = ema
+
+        quality = self._jpeg_quality
+        if ema > _PUSH_BUDGET_S and quality > _JPEG_QUALITY_MIN:
+            quality = max(_JPEG_QUALITY_MIN, quality - _JPEG_QUALITY_STEP)
+        elif ema < _PUSH_BUDGET_S * _PUSH_HEADROOM and quality < _JPEG_QUALITY_MAX:
+            quality = min(_JPEG_QUALITY_MAX, quality + _JPEG_QUALITY_STEP)
+        else:
+            return
+        logger.debug(
+            "Preview JPEG quality %d -> %d (push %.1f ms)",
+            self._jpeg_quality, quality, ema * 1000,
+        )
+        self._jpeg_quality = quality
+
+    def _downscale_for_preview(self: FletMainWindow, img_array):
+        """
+        Resize a frame to the size the COVER-fit video feed actually renders
+
+        The target size is cached in self._preview_size per source shape and
+        cleared on window resize.
+
+        Args:
+            img_array: Numpy array (RGB)
+
+        Returns:
+            The frame itself, or when it is noticeably larger than the
+            display, a resized copy in self._preview_buf (reused by the next
+            call, so it is only valid until then)
+        """
+        src_h, src_w = img_array.shape[:2]
+        cached = self._preview_size
+        if cached is None or cached[0] != (src_h, src_w):
+            # Same COVER-fit math as _display_to_image_coords
+            container_w = self.page.width or app_config.display_width
+            container_h = self.page.height or app_config.display_height
+            scale = max(container_w / src_w, container_h / src_h)
+            if scale < 0.95:
+                target = (int(src_w * scale), int(src_h * scale))
+            else:
+                target = None  # Already at (or below) display resolution
+            cached = ((src_h, src_w), target)
+            self._preview_size = cached
+
+        target = cached[1]
+        if target is None:
+            return img_array
+        dst_w, dst_h = target
+        buf = self._preview_buf
+        if buf is None or buf.shape != (dst_h, dst_w) + img_array.shape[2:]:
+            buf = np.empty((dst_h, dst_w) + img_array.shape[2:], dtype=img_array.dtype)
+            self._preview_buf = buf
+        return cv2.resize(img_array, target, dst=buf, interpolation=cv2.INTER_AREA)
+
+    def _publish_frame(self: FletMainWindow, img_array):
+        """
+        Hand a frame to the UI push thread, replacing any unsent one
 
-    def _draw_text_pil(
+        The array must not be written to afterwards; the processors build a
+        new one for every frame.
+
+        Args:
+            img_array: Numpy array (RGB)
+        """
+        self._frame_slot.put(img_array)
+
+    def _start_frame_pump(self: FletMainWindow):
+        """Start the UI push thread (video frames and the render tick for _mark)"""
+        if self._pump_thread and self._pump_thread.is_alive():
+            return
+        self._frame_slot.reopen()
+        self._pump_thread = threading.Thread(target=self._pump_to_flet, daemon=True)
+        self._pump_thread.start()
+
+    def _stop_frame_pump(self: FletMainWindow):
+        """Stop the UI push thread"""
+        self._frame_slot.close()  # Wakes the thread so it can exit
+        if self._pump_thread and self._pump_thread.is_alive():
+            self._pump_thread.join(timeout=1.0)
+        self._pump_thread = None
+
+    def _pump_to_flet(self: FletMainWindow):
+        """
+        UI push loop - encodes and pushes the newest frame, skipping stale ones
+
+        Also acts as the render tick: controls marked dirty via _mark() are
+        flushed together with the video frame in a single update.
+        """
+        # Bound once: this loop runs every tick for the life of the window
+        slot = self._frame_slot
+        monotonic = time.monotonic
+        encode = self._encode_preview
+        mark = self._mark
+        flush = self._flush
+
+        last_report = monotonic()
+        last_push = 0.0
+        while True:
+            # Hold off until the display interval has passed since the last
+            # pushed frame; anything that arrives meanwhile replaces it
+            wait = _MIN_PUSH_INTERVAL_S - (monotonic() - last_push)
+            if wait > 0:
+                time.sleep(wait)
+
+            frame = slot.get(timeout=_UI_TICK_S)
+            if frame is None and slot.closed:
+                break
+
+            # Report frames the UI was too slow to show, once per interval
+            now = monotonic()
+            if now - last_report >= _DROPPED_REPORT_INTERVAL_S:
+                dropped = slot.take_dropped()
+                if dropped:
+                    logger.debug("Video feed dropped %d stale frame(s)", dropped)
+                last_report = now
+
+            try:
+                img_base64 = None
+                if frame is not None:
+                    img_base64 = encode(frame)
+                if img_base64 is not None:
+                    # Update Flet image
+                    video_feed = self.video_feed
+                    video_feed.src_base64 = img_base64
+                    mark(video_feed)
+                    last_push = now
+
+                    # Hide loading placeholder on first frame
+                    if not self._first_frame_received:
+                        self.loading_placeholder.visible = False
+                        self._first_frame_received = True
+                        mark(self.loading_placeholder)
+
+                flush()
+                if img_base64 is not None:
+                    self._adapt_jpeg_quality(monotonic() - now)
+
+            except Exception as e:
+                print(f"Error pushing video frame: {e}")
+
+    def _draw_label(
         self: FletMainWindow,
         img,
         text,
@@ -80,10 +373,10 @@ class VideoDisplayMixin:
         corner_radius=8,
     ):
         """
-        Draw text using PIL for better font rendering with rounded corners
+        Draw a rounded label with TrueType text, using the cached glyph atlas
 
         Args:
-            img: numpy array (RGB)
+            img: numpy array (RGB), drawn on in place
             text: text to draw
             position: (x, y) position for text center
             font_size: size of font
@@ -97,29 +390,10 @@ class VideoDisplayMixin:
         Returns:
             Modified image
         """
-        # Convert to PIL Image
-        pil_img = Image.fromarray(img)
-        draw = ImageDraw.Draw(pil_img)
-
-        # Try to use a system font, fallback to default
-        try:
-            # Try common modern fonts
-            font = ImageFont.truetype(
-                "/System/Library/Fonts/SFNS.ttf", font_size
-            )  # macOS San Francisco
-        except:
-            try:
-                font = ImageFont.truetype(
-                    "/System/Library/Fonts/Helvetica.ttc", font_size
-                )  # macOS Helvetica
-            except:
-                try:
-                    font = ImageFont.truetype("arial.ttf", font_size)  # Windows
-                except:
-                    font = ImageFont.load_default()  # Fallback
+        atlas = get_glyph_atlas(font_size)
 
         # Get text bounding box
-        bbox = draw.textbbox((0, 0), text, font=font)
+        bbox = atlas.textbbox(text)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
         bbox_top_offset = bbox[1]  # Distance from baseline to top of bbox
@@ -135,43 +409,47 @@ class VideoDisplayMixin:
         bg_x2 = bg_x1 + total_width
         bg_y2 = bg_y1 + total_height
 
-        # Draw borders if specified (layered approach)
+        # Layered fills: white rim, colored border, then background inset
+        # by the border width (same result as outlined rounded rectangles)
         if border_color:
-            # Draw white outer outline on EXPANDED rectangle (sits outside colored border)
             white_rim = 3  # Width of visible white rim
-            draw.rounded_rectangle(
-                [
+            _fill_rounded_rect(
+                img,
+                (
                     bg_x1 - white_rim,
                     bg_y1 - white_rim,
                     bg_x2 + white_rim,
                     bg_y2 + white_rim,
-                ],
-                radius=corner_radius + white_rim,
-                outline=(255, 255, 255),  # White outer outline
-                width=white_rim,
+                ),
+                corner_radius + white_rim,
+                (255, 255, 255),
             )
-
-        # Draw rounded rectangle background
-        draw.rounded_rectangle(
-            [bg_x1, bg_y1, bg_x2, bg_y2], radius=corner_radius, fill=bg_color
-        )
-
-        # Draw colored border on top
-        if border_color:
-            draw.rounded_rectangle(
-                [bg_x1, bg_y1, bg_x2, bg_y2],
-                radius=corner_radius,
-                outline=border_color,
-                width=border_width,
+            _fill_rounded_rect(
+                img, (bg_x1, bg_y1, bg_x2, bg_y2), corner_radius, border_color
+            )
+            _fill_rounded_rect(
+                img,
+                (
+                    bg_x1 + border_width,
+                    bg_y1 + border_width,
+                    bg_x2 - border_width,
+                    bg_y2 - border_width,
+                ),
+                max(corner_radius - border_width, 0),
+                bg_color,
+            )
+        else:
+            _fill_rounded_rect(
+                img, (bg_x1, bg_y1, bg_x2, bg_y2), corner_radius, bg_color
             )
 
         # Draw text centered vertically in the box, accounting for bbox offset
         text_x = x
         text_y = bg_y1 + padding - bbox_top_offset
-        draw.text((text_x, text_y), text, font=font, fill=text_color)
+        mask, mask_left, mask_top = atlas.render(text)
+        blend_alpha_mask(img, mask, text_x + mask_left, text_y + mask_top, text_color)
 
-        # Convert back to numpy array
-        return np.array(pil_img)
+        return img
 
     def _calculate_label_positions(
         self: FletMainWindow, centers, classes, img_shape, font_size=42, padding=12
@@ -199,111 +477,31 @@ class VideoDisplayMixin:
         char_width = font_size * 0.6
         char_height = font_size * 1.2
 
-        labels_info = []
-        for cx, cy, class_name in zip(
-            [c[0] for c in centers], [c[1] for c in centers], classes
-        ):
-            # Estimate label size
-            label_text = f"#{len(labels_info) + 1}: {class_name}"
-            label_w = int(len(label_text) * char_width + padding * 2)
-            label_h = int(char_height + padding * 2)
-
-            # Initial position (centered above object)
-            label_x = cx - label_w // 2
-            label_y = cy - 30
-
-            labels_info.append(
-                {
-                    "cx": cx,
-                    "cy": cy,
-                    "x": float(label_x),
-                    "y": float(label_y),
-                    "w": label_w,
-                    "h": label_h,
-                }
-            )
-
-        # Apply force-directed layout
-        iterations = 50
-        for iteration in range(iterations):
-            forces = [{"x": 0.0, "y": 0.0} for _ in labels_info]
-
-            # Repulsion between overlapping labels
-            for i, label1 in enumerate(labels_info):
-                for j in range(i + 1, len(labels_info)):
-                    label2 = labels_info[j]
-
-                    # Check overlap with padding
-                    pad = 10
-                    l1_x1, l1_y1 = label1["x"] - pad, label1["y"] - pad
-                    l1_x2, l1_y2 = (
-                        label1["x"] + label1["w"] + pad,
-                        label1["y"] + label1["h"] + pad,
-                    )
-                    l2_x1, l2_y1 = label2["x"] - pad, label2["y"] - pad
-                    l2_x2, l2_y2 = (
-                        label2["x"] + label2["w"] + pad,
-                        label2["y"] + label2["h"] + pad,
-                    )
-
-                    overlap = not (
-                        l1_x2 < l2_x1 or l2_x2 < l1_x1 or l1_y2 < l2_y1 or l2_y2 < l1_y1
-                    )
+        # One array per label attribute for the solver
+        n = min(len(centers), len(classes))
+        cx = np.array([c[0] for c in centers[:n]], dtype=np.float64)
+        cy = np.array([c[1] for c in centers[:n]], dtype=np.float64)
+        text_len = np.array(
+            [len(f"#{i + 1}: {name}") for i, name in enumerate(classes[:n])],
+            dtype=np.float64,
+        )
+        w = (text_len * char_width + padding * 2).astype(np.int64)
+        h = np.full(n, int(char_height + padding * 2), dtype=np.int64)
 
-                    if overlap:
-                        # Calculate centers
-                        l1_cx = label1["x"] + label1["w"] / 2
-                        l1_cy = label1["y"] + label1["h"] / 2
-                        l2_cx = label2["x"] + label2["w"] / 2
-                        l2_cy = label2["y"] + label2["h"] / 2
-
-                        dx = l2_cx - l1_cx
-                        dy = l2_cy - l1_cy
-                        dist = np.sqrt(dx**2 + dy**2)
-
-                        if dist < 1:
-                            dx, dy = 20, 10
-                            dist = np.sqrt(dx**2 + dy**2)
-
-                        # Strong repulsion
-                        repulsion = 15.0
-                        fx = (dx / dist) * repulsion
-                        fy = (dy / dist) * repulsion
-
-                        forces[i]["x"] -= fx
-                        forces[i]["y"] -= fy
-                        forces[j]["x"] += fx
-                        forces[j]["y"] += fy
-
-            # Spring force toward anchor
-            spring = 0.15
-            for i, label in enumerate(labels_info):
-                desired_x = label["cx"] - label["w"] // 2
-                desired_y = label["cy"] - 30
-                forces[i]["x"] += (desired_x - label["x"]) * spring
-                forces[i]["y"] += (desired_y - label["y"]) * spring
-
-            # Apply forces with damping
-            damping = 0.8
-            for i, label in enumerate(labels_info):
-                label["x"] += forces[i]["x"] * damping
-                label["y"] += forces[i]["y"] * damping
-
-                # Keep in bounds
-                label["x"] = max(10, min(label["x"], img_width - label["w"] - 10))
-                label["y"] = max(10, min(label["y"], img_height - label["h"] - 10))
+        # Initial position (centered above object) is also the spring anchor
+        x, y = solve_label_layout(cx - w // 2, cy - 30, w, h, img_width, img_height)
 
         # Return positions as (x, y) tuples (center of label area)
-        return [
-            (int(l["x"] + l["w"] // 2), int(l["y"] + l["h"] // 2)) for l in labels_info
-        ]
+        return [(int(lx), int(ly)) for lx, ly in zip(x + w // 2, y + h // 2)]
 
-    def _enhance_frozen_labels(self: FletMainWindow, img_array):
+    def _enhance_frozen_labels(self: FletMainWindow, img_array, last_rgb=None):
         """
         Enhance object labels for frozen frame with larger numbered labels
 
         Args:
             img_array: Numpy array (RGB format) with existing detections (will be re-processed)
+            last_rgb: The processor's (raw frame, frame_id) tuple, read once
+                by the caller (None to fall back to img_array)
 
         Returns:
             Tuple of (image with enhanced labels, detection data dict)
@@ -316,17 +514,25 @@ class VideoDisplayMixin:
         if not detection_mgr.segmentation_model:
             return img_array, None
 
-        # Get the clean raw frame to detect on
-        if hasattr(self.image_processor, "_last_rgb_frame"):
-            clean_img = self.image_processor._last_rgb_frame.copy()
+        # Get the clean raw frame to detect on. No copy needed: detection
+        # only reads it and draw_object_mask blends into a new array, and
+        # the processor replaces its last frame rather than writing into it
+        if last_rgb is not None:
+            clean_img, frame_id = last_rgb
         else:
             # Fallback: use current image (will have old labels)
-            clean_img = img_array.copy()
-
-        # Detect on clean image - this is the ONLY detection we do
-        (boxes, classes, contours, centers) = (
-            detection_mgr.segmentation_model.detect_objects_mask(clean_img)
-        )
+            clean_img = img_array
+            frame_id = None
+
+        # Reuse the detection the processor ran on this exact frame; run the
+        # model again if the stored one is for another frame (or missing)
+        last_detection = detection_mgr.object_detection_for_frame(frame_id)
+        if last_detection is not None:
+            (boxes, classes, contours, centers) = last_detection
+        else:
+            (boxes, classes, contours, centers) = (
+                detection_mgr.segmentation_model.detect_objects_mask(clean_img)
+            )
 
         # Store detection data for button creation
         detections = {
@@ -359,10 +565,22 @@ class VideoDisplayMixin:
             centers, classes, img_with_masks.shape
         )
 
-        # Now draw our enhanced numbered labels with PIL for professional font rendering
+        # Seed the highlight cache for this freeze before labels are drawn,
+        # so the first selection/hover redraw can start from it
+        mask_key = tuple(selected_indices) if selected_indices else None
+        self._frozen_overlay = {
+            "detections": detections,
+            "label_positions": label_positions,
+            "masks": {mask_key: (img_with_masks.copy(), mask_colors)},
+        }
+
+        # Which labels moved far enough to need a connector (all at once)
+        leaders = needs_leader_line(centers, label_positions)
+
+        # Now draw our enhanced numbered labels with TrueType glyphs for professional font rendering
         # Only draw labels for selected object if one is selected
-        for i, (center, class_name, label_pos, mask_color) in enumerate(
-            zip(centers, classes, label_positions, mask_colors), start=1
+        for i, (center, class_name, label_pos, mask_color, leader) in enumerate(
+            zip(centers, classes, label_positions, mask_colors, leaders), start=1
         ):
             # Skip this label if an object is selected and this isn't it
             if self.selected_object is not None and (i - 1) != self.selected_object:
@@ -376,8 +594,7 @@ class VideoDisplayMixin:
             border_color_rgb = (mask_color[2], mask_color[1], mask_color[0])
 
             # Draw connector line if label moved significantly (using mask color)
-            distance = np.sqrt((label_x - x) ** 2 + (label_y - y) ** 2)
-            if distance > 30:
+            if leader:
                 cv2.line(
                     img_with_masks,
                     (x, y),
@@ -387,8 +604,8 @@ class VideoDisplayMixin:
                     cv2.LINE_AA,
                 )
 
-            # Draw using PIL for much better font rendering
-            img_with_masks = self._draw_text_pil(
+            # Draw with the TrueType glyph atlas for much better font rendering
+            img_with_masks = self._draw_label(
                 img_with_masks,
                 label,
                 (label_x, label_y),
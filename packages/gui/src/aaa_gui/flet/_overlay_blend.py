@@ -0,0 +1,72 @@
+"""Region-limited mask blending for frozen-frame highlights.
+
+Blending one object's mask used to copy and re-blend the whole frame.
+These helpers only touch pixels inside the contour's bounding box, and use
+a Numba kernel when numba is installed (falls back to NumPy otherwise).
+"""
+
+from __future__ import annotations
+
+import cv2
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, parallel=True, nogil=True)
+    def _blend_masked_kernel(roi, mask, color, alpha):
+        inv = 1.0 - alpha
+        h, w = mask.shape
+        for y in prange(h):
+            for x in range(w):
+                if mask[y, x]:
+                    for c in range(3):
+                        roi[y, x, c] = np.uint8(
+                            roi[y, x, c] * inv + color[c] * alpha + 0.5
+                        )
+
+
+def _blend_masked_numpy(roi, mask, color, alpha):
+    sel = mask.astype(bool)
+    roi[sel] = (roi[sel] * (1.0 - alpha) + color * alpha + 0.5).astype(np.uint8)
+
+
+def blend_contour(img, contour, color, alpha: float):
+    """
+    Alpha-blend a solid color into img inside contour, in place
+
+    Equivalent to filling the contour on a copy and cv2.addWeighted-ing the
+    copy back over the full frame, but limited to the contour's bounding box.
+
+    Args:
+        img: Numpy array (H, W, 3) uint8, modified in place
+        contour: OpenCV contour (N, 1, 2) or (N, 2) int array
+        color: 3-tuple in the same channel order as img
+        alpha: Weight of color (0-1)
+
+    Returns:
+        img
+    """
+    x, y, w, h = cv2.boundingRect(contour)
+    x1, y1 = max(x, 0), max(y, 0)
+    x2, y2 = min(x + w, img.shape[1]), min(y + h, img.shape[0])
+    if x2 <= x1 or y2 <= y1:
+        return img
+
+    mask = np.zeros((y2 - y1, x2 - x1), dtype=np.uint8)
+    cv2.fillPoly(mask, [contour], 1, offset=(-x1, -y1))
+
+    roi = img[y1:y2, x1:x2]
+    color_arr = np.asarray(color, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        _blend_masked_kernel(roi, mask, color_arr, float(alpha))
+    else:
+        _blend_masked_numpy(roi, mask, color_arr, float(alpha))
+    return img
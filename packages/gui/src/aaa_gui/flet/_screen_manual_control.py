@@ -14,6 +14,18 @@ from . import _design_tokens as T
 if TYPE_CHECKING:
     from .main_window import FletMainWindow
 
+# Icons resolved once at import rather than per control build
+_ICON_LEFT = ft.Icons.CHEVRON_LEFT
+_ICON_RIGHT = ft.Icons.CHEVRON_RIGHT
+_ICON_UP = ft.Icons.EXPAND_LESS
+_ICON_DOWN = ft.Icons.EXPAND_MORE
+_ICON_MODE = ft.Icons.CONTROL_CAMERA
+_ICON_BACK = ft.Icons.ARROW_BACK
+_ICON_FORWARD_Z = ft.Icons.ARROW_UPWARD
+_ICON_BACK_Z = ft.Icons.ARROW_DOWNWARD
+_ICON_GRIP_OPEN = ft.Icons.OPEN_WITH
+_ICON_GRIP_CLOSE = ft.Icons.BACK_HAND
+
 
 def build_screen_manual_control(window: FletMainWindow) -> ft.Container:
     """Build manual control screen with edge zones and bottom bar.
@@ -44,114 +56,65 @@ def build_screen_manual_control(window: FletMainWindow) -> ft.Container:
     window.top_zone_label = ft.Text("Up", size=T.TEXT_SM, color=T.WHITE, weight=ft.FontWeight.W_500)
     window.back_zone_label = ft.Text("Down", size=T.TEXT_SM, color=T.WHITE, weight=ft.FontWeight.W_500)
 
+    def _jog_detector(content, axis, direction):
+        """Tap jogs one step along axis; long-press jogs until released."""
+        return ft.GestureDetector(
+            content=content,
+            on_tap=lambda _: window._on_button_press(axis, direction),
+            on_long_press_start=lambda _: window._start_continuous_move(axis, direction),
+            on_long_press_end=lambda _: window._stop_continuous_move(),
+        )
+
+    def _make_edge_zone(icon, label, vertical, radius, width, height, axis, direction):
+        """Edge zone container + gesture detector for one jog direction."""
+        items = [ft.Icon(icon, size=40, color=T.WHITE), label]
+        if vertical:
+            content = ft.Column(
+                items,
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                alignment=ft.MainAxisAlignment.CENTER,
+                spacing=4,
+            )
+        else:
+            content = ft.Row(items, alignment=ft.MainAxisAlignment.CENTER, spacing=4)
+        container = ft.Container(
+            content=content,
+            bgcolor=ft.Colors.with_opacity(T.EDGE_ZONE_DEFAULT, T.BLUE_500),
+            border_radius=radius,
+            width=width,
+            height=height,
+            alignment=ft.alignment.center,
+            on_hover=_edge_hover,
+            ink=True,
+        )
+        return container, _jog_detector(container, axis, direction)
+
     # Left: X- (move left)  /  Yaw- in rotate mode
-    window.left_zone_container = ft.Container(
-        content=ft.Column(
-            [
-                ft.Icon(ft.Icons.CHEVRON_LEFT, size=40, color=T.WHITE),
-                window.left_zone_label,
-            ],
-            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-            alignment=ft.MainAxisAlignment.CENTER,
-            spacing=4,
-        ),
-        bgcolor=ft.Colors.with_opacity(T.EDGE_ZONE_DEFAULT, T.BLUE_500),
-        border_radius=ft.border_radius.only(
-            top_right=T.RADIUS_3XL, bottom_right=T.RADIUS_3XL,
-        ),
-        width=T.EDGE_ZONE_LR_W,
-        height=T.EDGE_ZONE_LR_H,
-        alignment=ft.alignment.center,
-        on_hover=_edge_hover,
-        ink=True,
-    )
-    left_zone = ft.GestureDetector(
-        content=window.left_zone_container,
-        on_tap=lambda _: window._on_button_press("x", "neg"),
-        on_long_press_start=lambda _: window._start_continuous_move("x", "neg"),
-        on_long_press_end=lambda _: window._stop_continuous_move(),
+    window.left_zone_container, left_zone = _make_edge_zone(
+        _ICON_LEFT, window.left_zone_label, True,
+        ft.border_radius.only(top_right=T.RADIUS_3XL, bottom_right=T.RADIUS_3XL),
+        T.EDGE_ZONE_LR_W, T.EDGE_ZONE_LR_H, "x", "neg",
     )
 
     # Right: X+ (move right)  /  Yaw+ in rotate mode
-    window.right_zone_container = ft.Container(
-        content=ft.Column(
-            [
-                ft.Icon(ft.Icons.CHEVRON_RIGHT, size=40, color=T.WHITE),
-                window.right_zone_label,
-            ],
-            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-            alignment=ft.MainAxisAlignment.CENTER,
-            spacing=4,
-        ),
-        bgcolor=ft.Colors.with_opacity(T.EDGE_ZONE_DEFAULT, T.BLUE_500),
-        border_radius=ft.border_radius.only(
-            top_left=T.RADIUS_3XL, bottom_left=T.RADIUS_3XL,
-        ),
-        width=T.EDGE_ZONE_LR_W,
-        height=T.EDGE_ZONE_LR_H,
-        alignment=ft.alignment.center,
-        on_hover=_edge_hover,
-        ink=True,
-    )
-    right_zone = ft.GestureDetector(
-        content=window.right_zone_container,
-        on_tap=lambda _: window._on_button_press("x", "pos"),
-        on_long_press_start=lambda _: window._start_continuous_move("x", "pos"),
-        on_long_press_end=lambda _: window._stop_continuous_move(),
+    window.right_zone_container, right_zone = _make_edge_zone(
+        _ICON_RIGHT, window.right_zone_label, True,
+        ft.border_radius.only(top_left=T.RADIUS_3XL, bottom_left=T.RADIUS_3XL),
+        T.EDGE_ZONE_LR_W, T.EDGE_ZONE_LR_H, "x", "pos",
     )
 
     # Top: Y+ (forward)  /  Pitch+ in rotate mode
-    window.top_zone_container = ft.Container(
-        content=ft.Row(
-            [
-                ft.Icon(ft.Icons.EXPAND_LESS, size=40, color=T.WHITE),
-                window.top_zone_label,
-            ],
-            alignment=ft.MainAxisAlignment.CENTER,
-            spacing=4,
-        ),
-        bgcolor=ft.Colors.with_opacity(T.EDGE_ZONE_DEFAULT, T.BLUE_500),
-        border_radius=ft.border_radius.only(
-            bottom_left=T.RADIUS_3XL, bottom_right=T.RADIUS_3XL,
-        ),
-        width=T.EDGE_ZONE_TB_W,
-        height=T.EDGE_ZONE_TB_H,
-        alignment=ft.alignment.center,
-        on_hover=_edge_hover,
-        ink=True,
-    )
-    top_zone = ft.GestureDetector(
-        content=window.top_zone_container,
-        on_tap=lambda _: window._on_button_press("y", "pos"),
-        on_long_press_start=lambda _: window._start_continuous_move("y", "pos"),
-        on_long_press_end=lambda _: window._stop_continuous_move(),
+    window.top_zone_container, top_zone = _make_edge_zone(
+        _ICON_UP, window.top_zone_label, False,
+        ft.border_radius.only(bottom_left=T.RADIUS_3XL, bottom_right=T.RADIUS_3XL),
+        T.EDGE_ZONE_TB_W, T.EDGE_ZONE_TB_H, "y", "pos",
     )
 
     # Bottom: Y- (back)  /  Pitch- in rotate mode — above the bottom bar
-    window.back_zone_container = ft.Container(
-        content=ft.Row(
-            [
-                ft.Icon(ft.Icons.EXPAND_MORE, size=40, color=T.WHITE),
-                window.back_zone_label,
-            ],
-            alignment=ft.MainAxisAlignment.CENTER,
-            spacing=4,
-        ),
-        bgcolor=ft.Colors.with_opacity(T.EDGE_ZONE_DEFAULT, T.BLUE_500),
-        border_radius=ft.border_radius.only(
-            top_left=T.RADIUS_3XL, top_right=T.RADIUS_3XL,
-        ),
-        width=T.EDGE_ZONE_TB_W,
-        height=T.EDGE_ZONE_TB_H,
-        alignment=ft.alignment.center,
-        on_hover=_edge_hover,
-        ink=True,
-    )
-    back_zone = ft.GestureDetector(
-        content=window.back_zone_container,
-        on_tap=lambda _: window._on_button_press("y", "neg"),
-        on_long_press_start=lambda _: window._start_continuous_move("y", "neg"),
-        on_long_press_end=lambda _: window._stop_continuous_move(),
+    window.back_zone_container, back_zone = _make_edge_zone(
+        _ICON_DOWN, window.back_zone_label, False,
+        ft.border_radius.only(top_left=T.RADIUS_3XL, top_right=T.RADIUS_3XL),
+        T.EDGE_ZONE_TB_W, T.EDGE_ZONE_TB_H, "y", "neg",
     )
 
     # --- Mode toggle button (top-right): Move ↔ Rotate ---
@@ -163,7 +126,7 @@ def build_screen_manual_control(window: FletMainWindow) -> ft.Container:
         )
         e.control.update()
 
-    window.mode_toggle_icon = ft.Icon(ft.Icons.CONTROL_CAMERA, size=20, color=T.WHITE)
+    window.mode_toggle_icon = ft.Icon(_ICON_MODE, size=20, color=T.WHITE)
     window.mode_toggle_text = ft.Text(
         "Move", size=T.TEXT_BASE, color=T.WHITE, weight=ft.FontWeight.W_500,
     )
@@ -190,7 +153,7 @@ def build_screen_manual_control(window: FletMainWindow) -> ft.Container:
     nav_back_btn = ft.Container(
         content=ft.Row(
             [
-                ft.Icon(ft.Icons.ARROW_BACK, size=20, color=T.WHITE),
+                ft.Icon(_ICON_BACK, size=20, color=T.WHITE),
                 ft.Text("Back", size=T.TEXT_BASE, color=T.WHITE, weight=ft.FontWeight.W_500),
             ],
             spacing=8,
@@ -233,37 +196,27 @@ def build_screen_manual_control(window: FletMainWindow) -> ft.Container:
         )
 
     up_btn_inner = _make_bottom_btn(
-        "Forward", ft.Icons.ARROW_UPWARD,
+        "Forward", _ICON_FORWARD_Z,
         T.GREEN_500,
         None,
     )
     window.z_pos_btn = up_btn_inner
-    up_btn = ft.GestureDetector(
-        content=up_btn_inner,
-        on_tap=lambda _: window._on_button_press("z", "pos"),
-        on_long_press_start=lambda _: window._start_continuous_move("z", "pos"),
-        on_long_press_end=lambda _: window._stop_continuous_move(),
-    )
+    up_btn = _jog_detector(up_btn_inner, "z", "pos")
 
     down_btn_inner = _make_bottom_btn(
-        "Back", ft.Icons.ARROW_DOWNWARD,
+        "Back", _ICON_BACK_Z,
         T.GREEN_500,
         None,
     )
     window.z_neg_btn = down_btn_inner
-    down_btn = ft.GestureDetector(
-        content=down_btn_inner,
-        on_tap=lambda _: window._on_button_press("z", "neg"),
-        on_long_press_start=lambda _: window._start_continuous_move("z", "neg"),
-        on_long_press_end=lambda _: window._stop_continuous_move(),
-    )
+    down_btn = _jog_detector(down_btn_inner, "z", "neg")
     open_grip_btn = _make_bottom_btn(
-        "Open", ft.Icons.OPEN_WITH,
+        "Open", _ICON_GRIP_OPEN,
         T.AMBER_500,
         lambda _: window._on_grip_state_changed(False),
     )
     close_grip_btn = _make_bottom_btn(
-        "Close", ft.Icons.BACK_HAND,
+        "Close", _ICON_GRIP_CLOSE,
         T.AMBER_500,
         lambda _: window._on_grip_state_changed(True),
     )
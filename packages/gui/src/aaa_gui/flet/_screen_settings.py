@@ -91,41 +91,37 @@ def build_screen_settings(window: FletMainWindow) -> ft.Container:
             padding=ft.padding.all(T.CARD_PADDING),
         )
 
-    # --- Camera section ---
-    daemon_running = window._check_daemon_running()
-    cameras = window.camera_manager.get_camera_info()
-    camera_options = []
-
-    if daemon_running:
-        camera_options.append(
-            ft.dropdown.Option(key="daemon", text="RealSense D435 (via daemon)")
-        )
-
-    for cam in cameras:
-        if cam.get("color_type") == "Infrared":
-            continue
-        if sys.platform == "darwin" and "RealSense" in cam["camera_name"]:
-            continue
-        name = cam["camera_name"]
-        if len(name) > 40:
-            name = name[:37] + "..."
-        camera_options.append(
-            ft.dropdown.Option(key=str(cam["camera_index"]), text=f"[{cam['camera_index']}] {name}")
+    # --- Helper: label on the left, action on the right ---
+    # Fixed 12-column split instead of a SPACE_BETWEEN Row, so the layout
+    # doesn't depend on measuring the children when the status text changes
+    def label_action_row(label, action):
+        return ft.ResponsiveRow(
+            [
+                ft.Container(content=label, col=8),
+                ft.Container(content=action, col=4, alignment=ft.alignment.center_right),
+            ],
+            columns=12,
+            spacing=8,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
         )
 
+    # --- Camera section ---
+    # Options are filled in by populate_settings_camera_dropdown() once the
+    # background camera scan finishes
     current_cam_value = None
     if hasattr(window, "camera_dropdown") and window.camera_dropdown:
         current_cam_value = window.camera_dropdown.value
 
     window.settings_camera_dropdown = ft.Dropdown(
         label="Camera Source",
-        options=camera_options,
+        options=[ft.dropdown.Option(key="scanning", text="Scanning cameras\u2026")],
         value=current_cam_value,
         on_change=lambda e: window._on_settings_camera_changed(e),
         width=380,
         text_size=T.TEXT_SM,
         border_radius=T.RADIUS_XL,
         border_color=T.GRAY_200,
+        disabled=True,
     )
 
     initial_flip = (
@@ -207,18 +203,15 @@ def build_screen_settings(window: FletMainWindow) -> ft.Container:
             [
                 section_header("Robotic Arm"),
                 setting_box(
-                    ft.Row(
-                        [
-                            ft.Column(
-                                [
-                                    ft.Text("Connection", size=T.TEXT_BASE, color=T.GRAY_700, weight=ft.FontWeight.W_500),
-                                    window.settings_arm_status,
-                                ],
-                                spacing=4,
-                            ),
-                            window.settings_arm_btn,
-                        ],
-                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+                    label_action_row(
+                        ft.Column(
+                            [
+                                ft.Text("Connection", size=T.TEXT_BASE, color=T.GRAY_700, weight=ft.FontWeight.W_500),
+                                window.settings_arm_status,
+                            ],
+                            spacing=4,
+                        ),
+                        window.settings_arm_btn,
                     ),
                 ),
                 setting_box(
@@ -261,12 +254,9 @@ def build_screen_settings(window: FletMainWindow) -> ft.Container:
                 setting_box(
                     ft.Column(
                         [
-                            ft.Row(
-                                [
-                                    ft.Text("Exposure", size=T.TEXT_BASE, color=T.GRAY_700, weight=ft.FontWeight.W_500),
-                                    window.settings_auto_exposure_btn,
-                                ],
-                                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+                            label_action_row(
+                                ft.Text("Exposure", size=T.TEXT_BASE, color=T.GRAY_700, weight=ft.FontWeight.W_500),
+                                window.settings_auto_exposure_btn,
                             ),
                             window.settings_exposure_slider,
                             window.settings_exposure_text,
@@ -286,14 +276,21 @@ def build_screen_settings(window: FletMainWindow) -> ft.Container:
             [
                 header,
                 ft.Divider(height=1, color=T.GRAY_200),
-                camera_section,
-                ft.Divider(height=1, color=T.GRAY_200),
-                arm_section,
-                ft.Divider(height=1, color=T.GRAY_200),
-                advanced_section,
+                # Only the section list scrolls; the header stays fixed
+                ft.Column(
+                    [
+                        camera_section,
+                        ft.Divider(height=1, color=T.GRAY_200),
+                        arm_section,
+                        ft.Divider(height=1, color=T.GRAY_200),
+                        advanced_section,
+                    ],
+                    spacing=0,
+                    scroll=ft.ScrollMode.AUTO,
+                    expand=True,
+                ),
             ],
             spacing=0,
-            scroll=ft.ScrollMode.AUTO,
         ),
         bgcolor=T.WHITE,
         width=500,
@@ -316,3 +313,58 @@ def build_screen_settings(window: FletMainWindow) -> ft.Container:
         ),
         expand=True,
     )
+
+
+def selectable_cameras(cameras: list) -> list:
+    """Cameras to offer in the camera dropdowns, sorted by index.
+
+    Drops infrared streams (and RealSense on macOS, which goes through the
+    daemon), and lists each (name, resolution) pair once so a device that
+    exposes several V4L2 nodes does not show up two or three times.
+    """
+    seen = set()
+    selectable = []
+    for cam in sorted(cameras, key=lambda c: c["camera_index"]):
+        if cam.get("color_type") == "Infrared":
+            continue
+        if sys.platform == "darwin" and "RealSense" in cam["camera_name"]:
+            continue
+        key = (cam["camera_name"], cam["resolution"])
+        if key in seen:
+            continue
+        seen.add(key)
+        selectable.append(cam)
+    return selectable
+
+
+def truncate_camera_name(name: str, limit: int) -> str:
+    """Shorten name to at most limit characters, ending in an ellipsis."""
+    if len(name) > limit:
+        return name[: limit - 3] + "..."
+    return name
+
+
+def populate_settings_camera_dropdown(
+    window: FletMainWindow, cameras: list, daemon_running: bool
+):
+    """Fill the settings camera dropdown from the enumerated camera list.
+
+    Mutates the control only; the caller is responsible for the page update.
+    """
+    camera_options = []
+
+    if daemon_running:
+        camera_options.append(
+            ft.dropdown.Option(key="daemon", text="RealSense D435 (via daemon)")
+        )
+
+    for cam in selectable_cameras(cameras):
+        name = truncate_camera_name(cam["camera_name"], 40)
+        camera_options.append(
+            ft.dropdown.Option(key=str(cam["camera_index"]), text=f"[{cam['camera_index']}] {name}")
+        )
+
+    dropdown = window.settings_camera_dropdown
+    dropdown.options = camera_options
+    dropdown.value = window.camera_dropdown.value if window.camera_dropdown else None
+    dropdown.disabled = False
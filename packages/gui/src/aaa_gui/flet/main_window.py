@@ -3,12 +3,13 @@ Flet Main Window
 Modern cross-platform GUI using Flet framework
 """
 
-import sys
+import asyncio
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
-from aaa_core.config.settings import app_config
+from aaa_core.config.settings import app_config, save_window_geometry
 from aaa_core.hardware.button_controller import ButtonController
 from aaa_core.hardware.camera_manager import CameraManager
 from aaa_core.workers.image_processor import ImageProcessor
@@ -29,18 +30,36 @@ if app_config.lite6_available:
     from aaa_core.workers.arm_controller_flet import ArmControllerFlet
 
 # Import mixins
-from ._mixin_arm_control import ArmControlMixin
+from ._camera_cache import camera_fingerprint, load_cache, save_cache
+from ._latest_slot import LatestSlot
+from ._mixin_arm_control import ArmControlMixin, _requires_arm
 from ._mixin_camera import CameraMixin
 from ._mixin_object_detection import ObjectDetectionMixin
 from ._mixin_point_cloud import PointCloudMixin
-from ._mixin_video_display import VideoDisplayMixin
+from ._mixin_video_display import _PLACEHOLDER_JPEG_B64, VideoDisplayMixin
 
 # Import screen builders
 from ._screen_live_view import build_screen_live_view
 from ._screen_object_selection import build_screen_object_selection
 from ._screen_grasp_preview import build_screen_grasp_preview
 from ._screen_manual_control import build_screen_manual_control
-from ._screen_settings import build_screen_settings, build_settings_dimmer
+from ._screen_settings import (
+    build_screen_settings,
+    build_settings_dimmer,
+    populate_settings_camera_dropdown,
+    selectable_cameras,
+    truncate_camera_name,
+)
+
+# Window geometry is saved once resizing/moving has paused this long,
+# rather than on every event of a drag
+_GEOMETRY_SAVE_DELAY_S = 0.3
+
+# Unmodified single-key shortcuts → handler method name
+_KEY_ACTIONS = {
+    "T": "_toggle_detection_mode",
+    "L": "_toggle_detection_logging",
+}
 
 
 class Screen(Enum):
@@ -114,19 +133,37 @@ class FletMainWindow(
         # Movement speed percentage (1-100%)
         self.movement_speed_percent = 20  # Default 20%
 
+        # Last known gripper position as (value, monotonic time); grip
+        # press-and-hold reuses it instead of querying the arm every repeat
+        self._grip_pos_cache = None
+
         # Control mode: "translate" (pan/zoom) or "rotate" (pitch/yaw/roll)
         self.control_mode = "translate"
 
+        # Press-and-hold repeat thread and its stop flag (while held)
+        self._hold_stop_event = None
+        self._hold_thread = None
+
+        # Live view status pill and arm badge (set by build_screen_live_view)
+        self.status_pill_dot = None
+        self.status_pill_text = None
+        self.arm_badge_icon = None
+
         # RealSense exposure control
         self.exposure_slider = None
         self.exposure_value_text = None
         self.using_realsense = False
+        # Slider drags are throttled (see _on_exposure_change)
+        self._exposure_pending = None  # Latest value not yet sent
+        self._exposure_last_sent = 0.0  # monotonic time of the last send
+        self._exposure_send_scheduled = False
 
         # Video freeze state for object detection
         self.video_frozen = False
         self.frozen_frame = None
         self.frozen_detections = None  # Store detection data when frozen
         self.frozen_raw_frame = None  # Store the raw frozen frame for re-highlighting
+        self._frozen_overlay = None  # Label positions/masks cached per freeze
         self.frozen_depth_frame = (
             None  # Store depth frame at freeze time (if available)
         )
@@ -138,16 +175,56 @@ class FletMainWindow(
         self.last_exported_ply = None  # Path to the last exported PLY file
         self._overlay_points = None  # Temporary overlay points to show on frozen frame
         self.object_buttons = []  # Store overlay buttons for frozen objects
+        self._object_button_pool = []  # Reused object buttons (see _build_object_button_pool)
         self.selected_object = None  # Currently selected object index
         self._hovered_object = None  # Currently hovered object card index
         self._camera_hovered_object = None  # Object hovered via camera label
 
+        # Latest-frame hand-off between the encode side (image processor
+        # thread) and the UI push thread; stale frames are overwritten
+        self._frame_slot = LatestSlot()
+        self._pump_thread = None
+        self._preview_size = None  # ((src_h, src_w), (dst_w, dst_h) or None)
+        self._shown_frozen = None  # (frozen_frame, _preview_size) last published
+        self._preview_buf = None  # Downscaled frame reused by the UI push thread
+        self._jpeg_quality = 80  # Preview JPEG quality (starts at _JPEG_QUALITY)
+        self._push_time_ema = None  # Smoothed encode + push seconds per frame
+
+        # Controls changed since the last render tick (see _mark / _flush)
+        self._dirty = set()
+        self._dirty_lock = threading.Lock()
+
+        # Background work started from button clicks (arm connect/disconnect,
+        # capture-and-freeze) shares one small pool instead of a new thread
+        # per click
+        self._bg_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="aaa-bg")
+        self._connect_gen = 0  # Bumped per connect/disconnect click
+        # Future of the latest arm connect/disconnect on _bg_pool; a new click
+        # cancels it if still queued and is ignored while it runs
+        self._pending_connect_future = None
+
+        # Tapped jog commands run on one long-lived worker, so rapid taps
+        # reach the arm in the order they were made
+        self._arm_cmd_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="aaa-arm-cmd"
+        )
+
         # Screen state machine
         self.current_screen = Screen.LIVE_VIEW
         self._screen_containers = {}
 
         # Track if UI is built to avoid page.update() during initialization
         self._ui_built = False
+        self._ui_ready = threading.Event()  # Set once _build_ui has finished
+        self._last_status_state = None  # Inputs of the last _update_status
+        # Latest (connected, message) from the arm controller, replayed once
+        # the UI exists if it arrived while the UI was still being built
+        self._pending_arm_status = None
+        self._daemon_check_time = None  # monotonic time of the last daemon probe
+        self._pending_geometry = None  # Window geometry not yet saved to config
+        self._geometry_event_time = 0.0  # monotonic time of the last resize/move
+        self._geometry_save_scheduled = False
+        self._daemon_check_result = False
 
         # Show loading screen immediately
         print("[DEBUG] Showing initial loading screen...")
@@ -158,8 +235,7 @@ class FletMainWindow(
 
         print("[DEBUG] Building UI...", flush=True)
         self._build_ui()
-        print("[DEBUG] Starting image processor...")
-        self._start_image_processor()
+        # Image processor starts from _enumerate_cameras_async once cameras are known
         print("[DEBUG] Initialization complete!")
 
     def _show_initial_loading_screen(self):
@@ -191,11 +267,7 @@ class FletMainWindow(
         )
 
         print("[DEBUG] _show_initial_loading_screen: adding to page...", flush=True)
-        self.page.add(loading_screen)
-        print(
-            "[DEBUG] _show_initial_loading_screen: calling page.update()...", flush=True
-        )
-        self.page.update()
+        self.page.add(loading_screen)  # add() already pushes the update
         print("[DEBUG] _show_initial_loading_screen: done", flush=True)
 
     def _setup_components(self):
@@ -217,62 +289,138 @@ class FletMainWindow(
                 on_error=self._on_arm_error,
             )
             print("[DEBUG] Arm controller created")
-            # Auto-connect to arm in a background thread if enabled in config.
+            # Auto-connect to arm if enabled in config. Runs as a task on the
+            # page's event loop; only the blocking connect goes to a worker thread.
             if app_config.lite6_auto_connect:
-                print(
-                    "[DEBUG] Auto-connect enabled - starting background connection thread for arm..."
-                )
+                print("[DEBUG] Auto-connect enabled - scheduling arm connection...")
                 try:
-
-                    def connect_async():
-                        try:
-                            print(
-                                f"[Arm] Connecting to arm at {app_config.lite6_ip}:{app_config.lite6_port}..."
-                            )
-                            self.arm_controller.connect_arm()
-                        except Exception as e:
-                            print(f"[Arm] Async connect failed: {e}")
-
-                    t = threading.Thread(target=connect_async, daemon=True)
-                    print("[DEBUG] About to start arm thread...", flush=True)
-                    t.start()
-                    print(
-                        "[DEBUG] Background arm connection thread started", flush=True
-                    )
+                    self.page.run_task(self._connect_arm_async)
                 except Exception as e:
                     print(
-                        f"[DEBUG] Failed to start arm connection thread: {e}",
+                        f"[DEBUG] Failed to schedule arm connection: {e}",
                         flush=True,
                     )
 
         print("[DEBUG] After arm controller section", flush=True)
 
-        # Debug: write to file since stdout/stderr might be captured
-        import sys
-        import time
-
-        print("[DEBUG] step A", file=sys.stderr, flush=True)
-        sys.stdout.flush()
-        sys.stderr.flush()
-        # Camera manager
-        time.sleep(0.1)  # Small delay to let arm thread settle
+        # Camera manager - probing every camera index is slow, so enumerate in
+        # the background and let the UI paint first (like the arm connect).
+        # The image processor is started once the camera list is known.
+        self.camera_manager = None
+        self.page.run_task(self._enumerate_cameras_async)
+        print("[DEBUG] _setup_components complete")
 
-        # NOTE: Skipping print() here - Flet blocks stdout after page.update()
+    async def _connect_arm_async(self):
+        """Connect to the arm without blocking the UI loop"""
+        print(f"[Arm] Connecting to arm at {app_config.lite6_ip}:{app_config.lite6_port}...")
+        # Tracked like a button-initiated connect, so a click while this runs
+        # doesn't start a second one
+        future = self._bg_pool.submit(self.arm_controller.connect_arm)
+        self._pending_connect_future = future
         try:
-            self.camera_manager = CameraManager(
-                max_cameras_to_check=app_config.max_cameras_to_check
-            )
-            print("[DEBUG] Camera manager created", flush=True)
+            await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            print("[Arm] Auto-connect superseded by a Connect click")
         except Exception as e:
-            print(f"[DEBUG] CameraManager failed: {e}", flush=True)
-            import traceback
+            print(f"[Arm] Async connect failed: {e}")
+
+    async def _enumerate_cameras_async(self):
+        """Enumerate cameras off the UI loop, then fill the dropdowns and start video"""
+        cameras, daemon_running = await asyncio.to_thread(self._enumerate_cameras)
 
-            traceback.print_exc()
-            raise
+        # Rebuild the dropdowns before starting video, since
+        # _start_image_processor reads the selected camera
+        await asyncio.to_thread(self._ui_ready.wait)
+        await self._populate_camera_dropdown(cameras, daemon_running)
+
+        print("[DEBUG] Starting image processor...")
+        await asyncio.to_thread(self._start_image_processor)
+
+    def _enumerate_cameras(self):
+        """
+        Create the camera manager and list cameras (blocking)
+
+        Returns:
+            Tuple of (cameras, daemon_running)
+        """
+        camera_manager = CameraManager(
+            max_cameras_to_check=app_config.max_cameras_to_check
+        )
+
+        # Reuse the last enumeration when the attached devices haven't changed
+        fingerprint = camera_fingerprint(camera_manager)
+        cameras = load_cache(fingerprint)
+        if cameras is not None:
+            camera_manager.cameras = cameras
+            print("[DEBUG] Using cached camera list", flush=True)
+        else:
+            try:
+                cameras = camera_manager.get_camera_info()
+                save_cache(fingerprint, cameras)
+                print("[DEBUG] Camera enumeration complete", flush=True)
+            except Exception as e:
+                print(f"[DEBUG] Camera enumeration failed: {e}", flush=True)
+                import traceback
+
+                traceback.print_exc()
+                cameras = []
+        self.camera_manager = camera_manager
 
         # Check for RealSense without daemon on macOS
         self._check_realsense_daemon_warning()
-        print("[DEBUG] _setup_components complete")
+        daemon_running = self._check_daemon_running()
+        return cameras, daemon_running
+
+    async def _populate_camera_dropdown(self, cameras, daemon_running):
+        """Rebuild camera options from the enumerated cameras (runs on the UI loop)"""
+        camera_options = []
+
+        if daemon_running:
+            camera_options.append(
+                ft.dropdown.Option(
+                    key="daemon",
+                    text="RealSense D435 (via daemon - with depth)",
+                )
+            )
+
+        for cam in selectable_cameras(cameras):
+            name = truncate_camera_name(cam["camera_name"], 70)
+            resolution = cam["resolution"]
+            if "RealSense" in cam["camera_name"] and resolution == "640x480":
+                resolution = "1920x1080"
+            display_text = (
+                f"[{cam['camera_index']}] {name} - {resolution} ({cam['color_type']})"
+            )
+            camera_options.append(
+                ft.dropdown.Option(
+                    key=str(cam["camera_index"]),
+                    text=display_text,
+                )
+            )
+
+        if len(camera_options) == 1:
+            camera_display_text = f"Camera: {camera_options[0].text}"
+            self.camera_dropdown = ft.Text(
+                camera_display_text, size=18, weight=ft.FontWeight.W_500, color="#1976D2",
+            )
+            self.camera_dropdown.value = camera_options[0].key
+        else:
+            dropdown_value = (
+                "daemon"
+                if daemon_running
+                else (str(app_config.default_camera) if camera_options else None)
+            )
+            self.camera_dropdown = ft.Dropdown(
+                label="Select Camera",
+                options=camera_options,
+                value=dropdown_value,
+                on_change=self._on_camera_changed,
+                width=600,
+                disabled=False,
+            )
+
+        populate_settings_camera_dropdown(self, cameras, daemon_running)
+        self.page.update()
 
     def _check_realsense_daemon_warning(self):
         """Check if RealSense is detected but daemon isn't running on macOS"""
@@ -349,15 +497,9 @@ class FletMainWindow(
     def _build_ui(self):
         """Build the Flet UI layout using screen-based Stack architecture."""
 
-        # Update loading message
-        self.loading_text.value = "Building interface..."
-        self.page.update()
-        # Clear the initial loading screen
-        self.page.clean()
-
         # Video feed display (full-screen, responsive)
         self.video_feed = ft.Image(
-            src_base64="",  # Will be updated by image processor
+            src_base64=_PLACEHOLDER_JPEG_B64,  # Replaced by the first camera frame
             fit=ft.ImageFit.COVER,
             expand=True,
         )
@@ -397,66 +539,20 @@ class FletMainWindow(
         self.object_buttons_row = ft.Row(
             controls=[], spacing=10, wrap=True, visible=False,
         )
+        self._build_object_button_pool()
 
         # Track if first frame has been received
         self._first_frame_received = False
 
-        # Check if daemon is running to determine camera options
-        daemon_running = self._check_daemon_running()
-
-        # Build camera dropdown (needed by _start_image_processor)
-        cameras = self.camera_manager.get_camera_info()
-        camera_options = []
-
-        if daemon_running:
-            camera_options.append(
-                ft.dropdown.Option(
-                    key="daemon",
-                    text="RealSense D435 (via daemon - with depth)",
-                )
-            )
-
-        for cam in cameras:
-            if cam.get("color_type") == "Infrared":
-                continue
-            if sys.platform == "darwin" and "RealSense" in cam["camera_name"]:
-                continue
-            name = cam["camera_name"]
-            if len(name) > 70:
-                name = name[:67] + "..."
-            resolution = cam["resolution"]
-            if "RealSense" in cam["camera_name"] and resolution == "640x480":
-                resolution = "1920x1080"
-            display_text = (
-                f"[{cam['camera_index']}] {name} - {resolution} ({cam['color_type']})"
-            )
-            camera_options.append(
-                ft.dropdown.Option(
-                    key=str(cam["camera_index"]),
-                    text=display_text,
-                )
-            )
-
-        if len(camera_options) == 1:
-            camera_display_text = f"Camera: {camera_options[0].text}"
-            self.camera_dropdown = ft.Text(
-                camera_display_text, size=18, weight=ft.FontWeight.W_500, color="#1976D2",
-            )
-            self.camera_dropdown.value = camera_options[0].key
-        else:
-            dropdown_value = (
-                "daemon"
-                if daemon_running
-                else (str(app_config.default_camera) if camera_options else None)
-            )
-            self.camera_dropdown = ft.Dropdown(
-                label="Select Camera",
-                options=camera_options,
-                value=dropdown_value,
-                on_change=self._on_camera_changed,
-                width=600,
-                disabled=False,
-            )
+        # Camera dropdown placeholder - _populate_camera_dropdown() replaces it
+        # once background enumeration finishes
+        self.camera_dropdown = ft.Dropdown(
+            label="Select Camera",
+            options=[ft.dropdown.Option(key="scanning", text="Scanning cameras\u2026")],
+            value="scanning",
+            width=600,
+            disabled=True,
+        )
 
         # Status text (kept for mixin compatibility)
         self.status_text = ft.Text("Initializing...", size=18, color="#455A64")
@@ -552,6 +648,10 @@ class FletMainWindow(
             container.visible = (screen == Screen.LIVE_VIEW)
 
         # --- Assemble the full-screen Stack ---
+        # Replace the loading screen in the same update as the add:
+        # page.clean() would send its own message and leave the window blank
+        # while the controls above are built
+        self.page.controls.clear()
         self.page.add(
             ft.Stack(
                 [
@@ -575,6 +675,16 @@ class FletMainWindow(
 
         # Mark UI as built to allow page.update() in callbacks
         self._ui_built = True
+        self._ui_ready.set()
+
+        # Start the render tick with the UI rather than with the camera, so
+        # controls marked before video starts (or if it never does) are sent
+        self._start_frame_pump()
+
+        # Show an arm status that was reported before the UI existed
+        pending, self._pending_arm_status = self._pending_arm_status, None
+        if pending is not None:
+            self._apply_arm_connection_status(*pending)
 
     # ------------------------------------------------------------------ #
     #  Screen Navigation                                                  #
@@ -603,15 +713,16 @@ class FletMainWindow(
                 self.object_card_row.controls.clear()
                 self.cards_loading_indicator.visible = True
 
-        # Handle detection mode changes
-        if screen == Screen.LIVE_VIEW:
-            if self.image_processor:
+        # Handle detection mode changes (only when the mode actually differs;
+        # the daemon processor logs every set_detection_mode call)
+        if screen in (Screen.LIVE_VIEW, Screen.MANUAL_CONTROL):
+            if (
+                self.image_processor
+                and self.image_processor.detection_mode != "camera"
+            ):
                 self.image_processor.set_detection_mode("camera")
-            if self.video_frozen:
+            if screen == Screen.LIVE_VIEW and self.video_frozen:
                 self._unfreeze_video()
-        elif screen == Screen.MANUAL_CONTROL:
-            if self.image_processor:
-                self.image_processor.set_detection_mode("camera")
 
         self._update_status()
         self.page.update()
@@ -641,12 +752,7 @@ class FletMainWindow(
     def _on_find_objects_and_navigate(self):
         """Find objects then navigate to object selection screen."""
         self._on_find_objects()
-        # Navigate after a brief delay to let detection start
-        def navigate_after_freeze():
-            # Wait for video to freeze (1 second capture + small buffer)
-            time.sleep(1.5)
-            self._navigate_to(Screen.OBJECT_SELECTION)
-        threading.Thread(target=navigate_after_freeze, daemon=True).start()
+        self.page.run_task(self._navigate_after_freeze, Screen.OBJECT_SELECTION)
 
     def _back_from_object_selection(self):
         """Go back from object selection to live view, unfreezing video."""
@@ -674,10 +780,19 @@ class FletMainWindow(
         """Re-scan: unfreeze, recapture, and go back to object selection."""
         self._unfreeze_video()
         self._on_find_objects()
-        def navigate_after_freeze():
-            time.sleep(1.5)
-            self._navigate_to(Screen.OBJECT_SELECTION)
-        threading.Thread(target=navigate_after_freeze, daemon=True).start()
+        self.page.run_task(self._navigate_after_freeze, Screen.OBJECT_SELECTION)
+
+    async def _navigate_after_freeze(self, screen: Screen, timeout: float = 1.5):
+        """
+        Navigate once Find Objects has frozen the video (or timeout passes)
+
+        Runs on the page's event loop, so the navigation's page update is
+        made from the UI side rather than a worker thread.
+        """
+        deadline = time.monotonic() + timeout
+        while not self.video_frozen and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        self._navigate_to(screen)
 
     # ------------------------------------------------------------------ #
     #  Object Card Population (for Screen 2)                              #
@@ -961,7 +1076,15 @@ class FletMainWindow(
             # Show analyzing spinner
             self._toggle_grip_buttons("analyzing")
 
-        self.page.update()
+        self._mark(
+            self.grasp_object_name,
+            self.grasp_badge_container,
+            self.grasp_confidence_bar,
+            self.grasp_confidence_text,
+            self.grasp_status_text,
+            self.grasp_shape_confidence_text,
+            self.grasp_dimensions_text,
+        )
 
     # ------------------------------------------------------------------ #
     #  Speed Segment Control                                              #
@@ -1090,6 +1213,10 @@ class FletMainWindow(
             self.flip_camera_btn.bgcolor = "#E0E0E0"
             self.flip_camera_btn.icon_color = "#424242"
 
+        # The UI push thread normally runs from _build_ui on; make sure it is
+        # up before frames start arriving
+        self._start_frame_pump()
+
         # Start processing thread
         print("[DEBUG MainWindow] Starting ImageProcessor thread...")
         self.image_processor.start()
@@ -1114,9 +1241,23 @@ class FletMainWindow(
             return
 
         has_depth = self.image_processor.use_realsense
+        mode = self.image_processor.detection_mode
+        has_detection = self.image_processor.has_object_detection
+        arm_connected = bool(
+            app_config.lite6_available
+            and self.arm_controller
+            and self.arm_controller.is_connected()
+        )
+
+        # Mode switches and camera changes call this repeatedly with the
+        # same state; skip rebuilding and re-sending identical controls
+        state = (has_depth, mode, has_detection, arm_connected)
+        if state == self._last_status_state:
+            return
+        self._last_status_state = state
+
         self.depth_toggle_btn.visible = has_depth
 
-        mode = self.image_processor.detection_mode
         mode_display = {
             "face": "Face Tracking",
             "objects": "Object Detection",
@@ -1130,32 +1271,23 @@ class FletMainWindow(
             if app_config.segmentation_model
             else "None"
         )
-        seg_status = (
-            seg_model
-            if self.image_processor.has_object_detection
-            else "Not available"
-        )
+        seg_status = seg_model if has_detection else "Not available"
         realsense_status = "With Depth" if has_depth else "RGB Only"
         self.status_text.value = (
             f"RealSense: {realsense_status} | Detection: {seg_status} | Mode: {mode_display}"
         )
 
         # Update new status pill on live view
-        if hasattr(self, "status_pill_text"):
+        if self.status_pill_text is not None:
             self.status_pill_text.value = mode_display
             # Green dot for active detection, grey for camera only
-            if hasattr(self, "status_pill_dot"):
+            if self.status_pill_dot is not None:
                 self.status_pill_dot.bgcolor = (
                     "#4CAF50" if mode != "camera" else "#78909C"
                 )
 
         # Update arm badge on live view
-        if hasattr(self, "arm_badge_icon"):
-            arm_connected = (
-                app_config.lite6_available
-                and self.arm_controller
-                and self.arm_controller.is_connected()
-            )
+        if self.arm_badge_icon is not None:
             if arm_connected:
                 self.arm_badge_icon.name = ft.Icons.LINK
                 self.arm_badge_icon.color = "#4CAF50"
@@ -1163,8 +1295,56 @@ class FletMainWindow(
                 self.arm_badge_icon.name = ft.Icons.LINK_OFF
                 self.arm_badge_icon.color = "#FF9800"
 
-        if self._ui_built:
-            self.page.update()
+        # Sent with the next render tick instead of diffing the whole page
+        self._mark(
+            self.depth_toggle_btn,
+            self.status_text,
+            self.status_pill_text,
+            self.status_pill_dot,
+            self.arm_badge_icon,
+        )
+
+    # ------------------------------------------------------------------ #
+    #  Batched UI updates                                                 #
+    # ------------------------------------------------------------------ #
+
+    def _mark(self, *controls):
+        """Queue controls for the next render tick (None entries are ignored)"""
+        with self._dirty_lock:
+            self._dirty.update(c for c in controls if c is not None)
+
+    def _flush(self):
+        """Send all controls marked since the last tick in one update"""
+        if not self._ui_built:
+            return
+        with self._dirty_lock:
+            if not self._dirty:
+                return
+            dirty, self._dirty = self._dirty, set()
+        # Controls that were never added to the page have nothing to update
+        mounted = [c for c in dirty if c.page is not None]
+        if mounted:
+            self.page.update(*mounted)
+
+    # ------------------------------------------------------------------ #
+    #  Background work                                                    #
+    # ------------------------------------------------------------------ #
+
+    def _submit_bg(self, fn, *args):
+        """
+        Run fn(*args) on the shared background pool
+
+        Exceptions are printed like an uncaught error in a thread would be,
+        rather than being held silently in the returned Future.
+        """
+
+        def report(future):
+            if not future.cancelled() and future.exception() is not None:
+                print(f"Background task {fn.__name__} failed: {future.exception()}")
+
+        future = self._bg_pool.submit(fn, *args)
+        future.add_done_callback(report)
+        return future
 
     # ------------------------------------------------------------------ #
     #  Keyboard and Window events                                         #
@@ -1183,10 +1363,10 @@ class FletMainWindow(
 
     def _on_keyboard_event(self, e: ft.KeyboardEvent):
         """Handle keyboard shortcuts"""
-        if e.key == "T" and e.shift is False and e.ctrl is False and e.alt is False:
-            self._toggle_detection_mode()
-        elif e.key == "L" and e.shift is False and e.ctrl is False and e.alt is False:
-            self._toggle_detection_logging()
+        action = _KEY_ACTIONS.get(e.key)
+        if action is not None:
+            if not (e.shift or e.ctrl or e.alt):
+                getattr(self, action)()
         elif e.key == "Escape":
             # Escape goes back from any screen to live view
             if self.current_screen == Screen.SETTINGS:
@@ -1198,17 +1378,23 @@ class FletMainWindow(
 
     def _on_window_event(self, e):
         """Handle window events (resized, moved, close, etc.)"""
-        from aaa_core.config.settings import save_window_geometry
-
         print(f"[DEBUG] Window event: {e.data}", flush=True)
 
         if e.data == "close":
             print("[DEBUG] Window close event received, cleaning up...", flush=True)
+            # Don't lose a resize/move that hasn't been written yet
+            geometry, self._pending_geometry = self._pending_geometry, None
+            if geometry:
+                save_window_geometry(**geometry)
             self.cleanup()
             print("[DEBUG] Destroying window...", flush=True)
             self.page.window.destroy()
             return
 
+        if e.data == "resized":
+            # Preview encode size follows the window size
+            self._preview_size = None
+
         if e.data in ("resized", "moved"):
             if (
                 self.page.window.width
@@ -1216,23 +1402,40 @@ class FletMainWindow(
                 and self.page.window.left is not None
                 and self.page.window.top is not None
             ):
-                save_window_geometry(
+                self._pending_geometry = dict(
                     width=int(self.page.window.width),
                     height=int(self.page.window.height),
                     left=int(self.page.window.left),
                     top=int(self.page.window.top),
                 )
+                self._geometry_event_time = time.monotonic()
+                if not self._geometry_save_scheduled:
+                    self._geometry_save_scheduled = True
+                    self.page.run_task(self._save_geometry_when_idle)
+
+    async def _save_geometry_when_idle(self):
+        """Write the latest window geometry once resize/move events pause"""
+        while True:
+            wait = _GEOMETRY_SAVE_DELAY_S - (
+                time.monotonic() - self._geometry_event_time
+            )
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+        self._geometry_save_scheduled = False
+        geometry, self._pending_geometry = self._pending_geometry, None
+        if geometry:
+            # Reads and rewrites config.yaml
+            await asyncio.to_thread(save_window_geometry, **geometry)
 
     # ------------------------------------------------------------------ #
     #  Arm commands (kept for mixin compatibility)                        #
     # ------------------------------------------------------------------ #
 
+    @_requires_arm("Arm not connected - cannot execute grasp")
     def _on_execute(self):
         """Handle Execute button - confirms grasp plan and begins arm motion"""
         print("Execute: Beginning grasp motion...")
-        if not self.arm_controller or not self.arm_controller.arm:
-            print("Arm not connected - cannot execute grasp")
-            return
         print("Grasp execution not yet implemented")
 
     # ------------------------------------------------------------------ #
@@ -1248,7 +1451,9 @@ class FletMainWindow(
         self.grip_analyzing_row.visible = (state == "analyzing")
         self.grip_decision_row.visible = (state == "decision")
         self.grip_nudge_row.visible = (state == "nudge")
-        self.page.update()
+        self._mark(
+            self.grip_analyzing_row, self.grip_decision_row, self.grip_nudge_row
+        )
 
     def _on_accept_grip(self):
         """Accept the current grip proposal — delegates to _on_execute."""
@@ -1289,25 +1494,41 @@ class FletMainWindow(
         self.arm_controller.emergency_stop()
         print("Arm stopped")
 
+    @_requires_arm("Arm not connected - cannot move to home")
     def _on_home(self):
         """Handle Home button - returns arm to safe rest position"""
         print("Home: Returning to rest position...")
-        if not self.arm_controller or not self.arm_controller.arm:
-            print("Arm not connected - cannot move to home")
-            return
         self.arm_controller.home()
         print("Moving to home position")
 
     def cleanup(self):
         """Clean up resources"""
         print("[DEBUG] Cleaning up resources...")
+        # The processor, button and arm shutdowns each wait on their own
+        # subsystem (thread joins, socket close), so run them side by side
+        shutdowns = []
         if self.image_processor:
             print("[DEBUG] Stopping image processor...")
-            self.image_processor.stop()
+            shutdowns.append(("image processor", self.image_processor.stop))
         if self.button_controller:
             print("[DEBUG] Stopping button controller...")
-            self.button_controller.stop()
+            shutdowns.append(("button controller", self.button_controller.stop))
         if self.arm_controller:
             print("[DEBUG] Disconnecting arm...")
-            self.arm_controller.disconnect_arm()
+            shutdowns.append(("arm", self.arm_controller.disconnect_arm))
+
+        if shutdowns:
+            with ThreadPoolExecutor(
+                max_workers=len(shutdowns), thread_name_prefix="aaa-shutdown"
+            ) as pool:
+                futures = [(name, pool.submit(fn)) for name, fn in shutdowns]
+                for name, future in futures:
+                    try:
+                        future.result(timeout=5.0)
+                    except Exception as e:
+                        print(f"[DEBUG] Error stopping {name}: {e}")
+
+        self._stop_frame_pump()
+        self._bg_pool.shutdown(wait=False, cancel_futures=True)
+        self._arm_cmd_pool.shutdown(wait=False, cancel_futures=True)
         print("[DEBUG] Cleanup complete")
@@ -6,6 +6,7 @@ using the xArm Python SDK.
 """
 
 import io
+import logging
 import os
 import sys
 from contextlib import redirect_stderr, redirect_stdout
@@ -15,6 +16,8 @@ from typing import Optional, Tuple
 with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
     from xarm.wrapper import XArmAPI
 
+logger = logging.getLogger(__name__)
+
 
 class Lite6Arm:
     """
@@ -123,8 +126,10 @@ class Lite6Arm:
                     speed=speed,
                     wait=wait
                 )
-                print(f"[Lite6] Moved to: x={x}, y={y}, z={z}, "
-                      f"r={roll}, p={pitch}, y={yaw}")
+                logger.debug(
+                    "[Lite6] Moved to: x=%s, y=%s, z=%s, r=%s, p=%s, y=%s",
+                    x, y, z, roll, pitch, yaw,
+                )
             else:
                 # Position only, maintain current orientation
                 code = self.arm.set_position(
@@ -132,7 +137,7 @@ class Lite6Arm:
                     speed=speed,
                     wait=wait
                 )
-                print(f"[Lite6] Moved to position: x={x}, y={y}, z={z}")
+                logger.debug("[Lite6] Moved to position: x=%s, y=%s, z=%s", x, y, z)
 
             if code == 0:
                 return True
@@ -180,10 +185,11 @@ class Lite6Arm:
                 wait=wait,
             )
             if code == 0:
-                print(
-                    f"[Lite6] Tool-relative move: "
-                    f"dx={dx:.1f} dy={dy:.1f} dz={dz:.1f} "
-                    f"dr={droll:.1f} dp={dpitch:.1f} dyw={dyaw:.1f}"
+                # Sent on every press-and-hold repeat
+                logger.debug(
+                    "[Lite6] Tool-relative move: "
+                    "dx=%.1f dy=%.1f dz=%.1f dr=%.1f dp=%.1f dyw=%.1f",
+                    dx, dy, dz, droll, dpitch, dyaw,
                 )
                 return True
             else:
@@ -321,6 +327,25 @@ class Lite6Arm:
             print(f"[Lite6] Get gripper position error: {e}")
             return None
 
+    def get_queued_commands(self) -> Optional[int]:
+        """
+        Get the number of motion commands buffered in the controller
+
+        Returns:
+            Queued command count or None if error
+        """
+        if not self.connected or not self.arm:
+            return None
+
+        try:
+            code, count = self.arm.get_cmdnum()
+            if code == 0:
+                return count
+            return None
+        except Exception as e:
+            print(f"[Lite6] Get command count error: {e}")
+            return None
+
     def home(self) -> bool:
         """
         Move arm to home position
@@ -13,6 +13,7 @@ from aaa_core.config.console import status
 from aaa_core.config.settings import app_config
 
 from aaa_vision.depth_validator import DepthValidator
+from aaa_vision.detection_record import ObjectDetectionRecord
 from aaa_vision.detection_logger import DetectionLogger
 from aaa_vision.face_detector import FaceDetector
 from aaa_vision.object_tracker import ObjectTracker
@@ -61,6 +62,13 @@ class DetectionManager:
             dummy_image = np.zeros((10, 10, 3), dtype=np.uint8)
             self.face_detector.mesh.process(dummy_image)
 
+        # Raw (boxes, classes, contours, centers) from the most recent object
+        # detection, tagged with its frame so callers can reuse it for that
+        # frame instead of running the model again. Cleared on mode changes
+        self.object_detections = ObjectDetectionRecord()
+        self._detection_mode = None
+        self._frame_id = None  # Id of the frame being processed
+
         # Initialize segmentation model if available
         self.segmentation_model = None
         if app_config.segmentation_available:
@@ -107,6 +115,57 @@ class DetectionManager:
         # Initialize detection logger (disabled by default, enable with toggle_logging())
         self.logger = DetectionLogger(enabled=False)
 
+    @property
+    def detection_mode(self) -> str:
+        """Current detection mode ("objects", "combined", "face", "camera")"""
+        return self._detection_mode
+
+    @detection_mode.setter
+    def detection_mode(self, mode: str):
+        # A stored detection may be from long before the mode changed back
+        if mode != self._detection_mode:
+            self.object_detections.clear()
+        self._detection_mode = mode
+
+    @property
+    def object_detection_count(self) -> int:
+        """Number of object detections run so far"""
+        return self.object_detections.count
+
+    def _record_object_detection(self, detection):
+        """Store an object detection result for the frame being processed"""
+        self.object_detections.record(detection, self._frame_id)
+
+    def object_detection_for_frame(self, frame_id: Optional[int]):
+        """
+        Get the stored object detection if it was run on frame_id
+
+        Args:
+            frame_id: Id the image processor gave the frame
+
+        Returns:
+            (boxes, classes, contours, centers) tuple, or None if the stored
+            result is for a different frame (or there is none)
+        """
+        return self.object_detections.get(frame_id)
+
+    def clear_object_detection(self):
+        """Forget the stored object detection (e.g. after a camera change)"""
+        self.object_detections.clear()
+
+    def wait_for_object_detections(self, count: int, timeout: float) -> bool:
+        """
+        Block until object_detection_count reaches count
+
+        Args:
+            count: Detection count to wait for
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the count was reached, False on timeout
+        """
+        return self.object_detections.wait_for(count, timeout)
+
     def _initialize_segmentation_model(self):
         """Initialize the appropriate segmentation model"""
         try:
@@ -135,7 +194,10 @@ class DetectionManager:
             return None
 
     def process_frame(
-        self, image: np.ndarray, depth_frame: Optional[np.ndarray] = None
+        self,
+        image: np.ndarray,
+        depth_frame: Optional[np.ndarray] = None,
+        frame_id: Optional[int] = None,
     ) -> np.ndarray:
         """
         Process a frame using the current detection mode
@@ -143,10 +205,13 @@ class DetectionManager:
         Args:
             image: RGB image array
             depth_frame: Optional depth frame for distance measurements
+            frame_id: Optional id of the frame, stored with its object
+                detection (see object_detection_for_frame)
 
         Returns:
             Processed image with detections drawn
         """
+        self._frame_id = frame_id
         if self.detection_mode == "camera":
             # Camera only mode - return raw image
             return image
@@ -166,6 +231,7 @@ class DetectionManager:
          contours, centers) = self.segmentation_model.detect_objects_mask(
             image
         )
+        self._record_object_detection((boxes, classes, contours, centers))
 
         # Extract depth values at object centers
         depths = None
@@ -391,6 +457,7 @@ class DetectionManager:
          contours, centers) = self.segmentation_model.detect_objects_mask(
             image
         )
+        self._record_object_detection((boxes, classes, contours, centers))
 
         # Extract depth values at object centers
         depths = None
@@ -0,0 +1,76 @@
+"""
+Object Detection Record
+Keeps the latest object detection result together with the frame it ran on
+"""
+
+import threading
+from typing import Optional
+
+
+class ObjectDetectionRecord:
+    """
+    Latest (boxes, classes, contours, centers) tagged with its frame id
+
+    A stored result is only handed out for the exact frame it was computed
+    on, so callers drawing on a newer frame (or after the record was
+    cleared) fall back to running detection themselves.
+    """
+
+    def __init__(self):
+        """Initialize an empty record"""
+        self._cond = threading.Condition()
+        self._detection = None
+        self._frame_id = None
+        # Detections recorded so far; clear() does not reset it, so waiters
+        # counting from an earlier value are never stranded
+        self.count = 0
+
+    def record(self, detection, frame_id: Optional[int] = None):
+        """
+        Store a detection result and wake anyone waiting for it
+
+        Args:
+            detection: (boxes, classes, contours, centers) tuple
+            frame_id: Id of the frame the detection ran on (None if unknown)
+        """
+        with self._cond:
+            self._detection = detection
+            self._frame_id = frame_id
+            self.count += 1
+            self._cond.notify_all()
+
+    def get(self, frame_id: Optional[int]):
+        """
+        Return the stored detection if it was computed on frame_id
+
+        Args:
+            frame_id: Id of the frame the caller is about to draw on
+
+        Returns:
+            (boxes, classes, contours, centers) tuple, or None if there is no
+            result for that frame
+        """
+        with self._cond:
+            if frame_id is None or frame_id != self._frame_id:
+                return None
+            return self._detection
+
+    def clear(self):
+        """Forget the stored detection (e.g. after a mode or camera change)"""
+        with self._cond:
+            self._detection = None
+            self._frame_id = None
+
+    def wait_for(self, count: int, timeout: float) -> bool:
+        """
+        Block until at least count detections have been recorded
+
+        Args:
+            count: Detection count to wait for
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the count was reached, False on timeout
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self.count >= count, timeout)
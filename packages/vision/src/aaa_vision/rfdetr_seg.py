@@ -315,9 +315,6 @@ class RFDETRSeg:
         if boxes is None:
             boxes, classes, contours, _ = self.detect_objects_mask(frame)
 
-        # Create overlay for masks
-        overlay = frame.copy()
-
         # Use provided colors or generate from class name hash
         if colors is None:
             colors = []
@@ -334,16 +331,30 @@ class RFDETRSeg:
             # Cycle colors if fewer than objects
             colors = [colors[i % len(colors)] for i in range(len(classes))]
 
-        # Draw masks (only for selected indices if specified)
-        for i, contour in enumerate(contours):
-            if selected_indices is not None and i not in selected_indices:
-                continue
-            if i < len(colors):
-                cv2.fillPoly(overlay, [contour], colors[i])
+        # Masks to draw (only for selected indices if specified)
+        drawn = [
+            i for i, contour in enumerate(contours)
+            if (selected_indices is None or i in selected_indices)
+            and i < len(colors) and len(contour)
+        ]
 
-        # Blend overlay with original frame
+        # Blend masks into a copy of the frame, limited to the region they
+        # cover (blending the rest of a full-resolution frame with an
+        # unchanged overlay would leave it as it was)
         alpha = 0.4
-        frame = cv2.addWeighted(frame, 1 - alpha, overlay, alpha, 0)
+        frame = frame.copy()
+        if drawn:
+            x, y, w, h = cv2.boundingRect(
+                np.vstack([contours[i].reshape(-1, 2) for i in drawn]).astype(np.int32)
+            )
+            x1, y1 = max(x, 0), max(y, 0)
+            x2, y2 = min(x + w, frame.shape[1]), min(y + h, frame.shape[0])
+            if x2 > x1 and y2 > y1:
+                roi = frame[y1:y2, x1:x2]
+                overlay = roi.copy()
+                for i in drawn:
+                    cv2.fillPoly(overlay, [contours[i]], colors[i], offset=(-x1, -y1))
+                roi[:] = cv2.addWeighted(roi, 1 - alpha, overlay, alpha, 0)
 
         # Draw contours (only for selected indices if specified)
         for i, contour in enumerate(contours):
@@ -0,0 +1,94 @@
+"""
+Test script for the object detection record
+Verifies that stored detections are only reused for the frame they ran on
+"""
+
+import threading
+import time
+
+from aaa_vision.detection_record import ObjectDetectionRecord
+
+
+def make_detection(label="cup"):
+    """Create a minimal (boxes, classes, contours, centers) tuple"""
+    return ([[10, 10, 20, 20]], [label], [None], [(20, 20)])
+
+
+def test_record_matches_frame():
+    """A detection is returned only for the frame id it was recorded with"""
+    record = ObjectDetectionRecord()
+    detection = make_detection()
+
+    assert record.get(1) is None
+    record.record(detection, frame_id=1)
+
+    assert record.get(1) is detection
+    assert record.get(2) is None  # Newer frame: caller must re-detect
+    assert record.get(None) is None  # Frame without an id never matches
+    assert record.count == 1
+
+    print("✓ Stored detection is tied to its frame id")
+
+
+def test_record_without_frame_id():
+    """Detections recorded without a frame id are never reused"""
+    record = ObjectDetectionRecord()
+    record.record(make_detection())
+
+    assert record.get(None) is None
+    assert record.get(1) is None
+
+    print("✓ Detections without a frame id are not reused")
+
+
+def test_clear():
+    """clear() drops the stored detection but keeps the count"""
+    record = ObjectDetectionRecord()
+    record.record(make_detection(), frame_id=5)
+    record.clear()
+
+    assert record.get(5) is None
+    assert record.count == 1
+
+    # Recording after a clear works as before
+    detection = make_detection("bottle")
+    record.record(detection, frame_id=6)
+    assert record.get(6) is detection
+    assert record.count == 2
+
+    print("✓ clear() forgets the stored detection")
+
+
+def test_wait_for():
+    """wait_for() returns once enough detections have been recorded"""
+    record = ObjectDetectionRecord()
+
+    # Times out when nothing is recorded
+    start = time.perf_counter()
+    assert not record.wait_for(1, timeout=0.05)
+    assert time.perf_counter() - start >= 0.04
+
+    # Wakes up when another thread records detections
+    def producer():
+        for frame_id in range(1, 4):
+            time.sleep(0.01)
+            record.record(make_detection(), frame_id=frame_id)
+
+    thread = threading.Thread(target=producer)
+    thread.start()
+    assert record.wait_for(3, timeout=2.0)
+    thread.join()
+    assert record.count == 3
+
+    # Already reached: returns immediately
+    assert record.wait_for(2, timeout=0)
+
+    print("✓ wait_for() wakes on recorded detections")
+
+
+if __name__ == "__main__":
+    test_record_matches_frame()
+    test_record_without_frame_id()
+    test_clear()
+    test_wait_for()
+    print("\nALL TESTS PASSED ✓")